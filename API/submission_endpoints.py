@@ -1,8 +1,6 @@
 # API/submission_endpoints.py
 from __future__ import annotations
 
-import shutil
-from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, File, Form, UploadFile, HTTPException, Depends, Request, status
@@ -21,9 +19,6 @@ engine = ReviewEngine()
 report_generator = ReportGenerator(output_dir="reports")
 ingestor = DocumentIngestor()
 
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
-
 
 @router.post(
     "/submit",
@@ -47,10 +42,9 @@ async def submit_paper(
 
     try:
         if file:
-            file_path = UPLOAD_DIR / file.filename
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
-            doc = ingestor.ingest(file_path)
+            # Ingested from memory; re-submitting the same file hits the
+            # ingestor's content cache instead of re-parsing it
+            doc = ingestor.ingest_bytes(await file.read(), file.filename)
             result = engine.review_paper(doc)
         else:
             result = engine.review_paper(text or "")
@@ -36,6 +36,11 @@ class HallucinationDetector:
         r"supports? the hypothesis.*fails? to reach significance",
     ]
 
+    # Quantitative signals for check_evidence_alignment
+    DIGIT_PATTERN = re.compile(r"\d")
+    P_VALUE_PATTERN = re.compile(r"p\s*[<=>]", re.IGNORECASE)
+    EFFECT_TERM_PATTERN = re.compile(r"effect|correlation|difference|regression", re.IGNORECASE)
+
     def __init__(self) -> None:
         self.compiled_high_risk = [re.compile(p, re.IGNORECASE) for p in self.HIGH_RISK_CLAIMS]
         self.compiled_contradictions = [re.compile(p, re.IGNORECASE) for p in self.CONTRADICTION_PATTERNS]
@@ -73,9 +78,9 @@ class HallucinationDetector:
 
     def check_evidence_alignment(self, claim_text: str, supporting_text: str) -> Dict[str, Any]:
         """Lightweight check: does supporting text contain quantitative signals?"""
-        has_numbers = bool(re.search(r"\d", supporting_text))
-        has_p_value = bool(re.search(r"p\s*[<=>]", supporting_text, re.IGNORECASE))
-        has_effect = bool(re.search(r"effect|correlation|difference|regression", supporting_text, re.IGNORECASE))
+        has_numbers = bool(self.DIGIT_PATTERN.search(supporting_text))
+        has_p_value = bool(self.P_VALUE_PATTERN.search(supporting_text))
+        has_effect = bool(self.EFFECT_TERM_PATTERN.search(supporting_text))
 
         evidence_strength = sum([has_numbers, has_p_value, has_effect])
 
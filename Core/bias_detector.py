@@ -4,6 +4,8 @@ import re
 from collections import Counter
 from typing import List, Dict
 
+from Core.ingestion.text_view import TextView
+
 
 class BiasDetector:
     """
@@ -12,6 +14,8 @@ class BiasDetector:
     auditable first-pass signal generator.
     """
 
+    TOKEN_PATTERN = re.compile(r"[a-z']+")
+
     def __init__(self) -> None:
         # You can expand/tune these lists over time.
         self.emotional_words = {
@@ -43,7 +47,7 @@ class BiasDetector:
 
     # ---------- Public API ----------
 
-    def analyze_text(self, text: str) -> Dict:
+    def analyze_text(self, text: str | TextView) -> Dict:
         """
         Main entry point.
         Returns a dictionary with bias-related metrics.
@@ -106,13 +110,12 @@ class BiasDetector:
 
     # ---------- Internal helpers ----------
 
-    def _tokenize(self, text: str) -> List[str]:
+    def _tokenize(self, text: str | TextView) -> List[str]:
         """
         Very simple tokenizer: lowercase + split on non-letters.
         This keeps the logic transparent and dependency-free.
         """
-        text = text.lower()
-        return re.findall(r"[a-z']+", text)
+        return self.TOKEN_PATTERN.findall(TextView.of(text).lower)
 
     def _find_matches(self, tokens: List[str], vocab: set) -> Dict:
         """
@@ -3,6 +3,8 @@
 import re
 from typing import Dict, Any, List
 
+from Core.ingestion.text_view import TextView
+
 
 class CitationValidator:
     """
@@ -24,6 +26,8 @@ class CitationValidator:
         re.MULTILINE,
     )
     BRACKET_PATTERN = re.compile(r"\[(\d+(?:\s*[,;]\s*\d+)*)\]")
+    YEAR_PATTERN = re.compile(r"(19|20)\d{2}")
+    NUMBER_PATTERN = re.compile(r"\d+")
 
     REF_KEYWORDS = [
         "references",
@@ -32,12 +36,13 @@ class CitationValidator:
         "reference list",
     ]
 
-    def _find_references_section(self, text: str) -> List[str]:
+    def _find_references_section(self, text: str | TextView) -> List[str]:
         """
         Roughly slice out the references section and return a list of lines
         that look like they belong to the reference list.
         """
-        text_lower = text.lower()
+        view = TextView.of(text)
+        text, text_lower = view.text, view.lower
         start_idx = None
         for kw in self.REF_KEYWORDS:
             idx = text_lower.find(kw)
@@ -56,12 +61,12 @@ class CitationValidator:
             if not stripped:
                 continue
             # A crude heuristic: year or a period suggests a reference line
-            if re.search(r"(19|20)\d{2}", stripped) or "." in stripped:
+            if self.YEAR_PATTERN.search(stripped) or "." in stripped:
                 ref_lines.append(stripped)
 
         return ref_lines
 
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def analyze(self, text: str | TextView) -> Dict[str, Any]:
         """
         Analyze citation-related structure and return a dictionary with:
             - has_references_section (bool)
@@ -69,7 +74,9 @@ class CitationValidator:
             - doi, urls, in_text_citations, bracket_citations (counts + examples)
             - overall_citation_quality_score (float)
         """
-        if not text.strip():
+        view = TextView.of(text)
+        text = view.text
+        if view.is_blank:
             return {
                 "has_references_section": False,
                 "estimated_reference_count": 0,
@@ -81,7 +88,7 @@ class CitationValidator:
             }
 
         # References section
-        ref_lines = self._find_references_section(text)
+        ref_lines = self._find_references_section(view)
         has_ref_section = len(ref_lines) > 0
         estimated_ref_count = len(ref_lines)
 
@@ -95,17 +102,17 @@ class CitationValidator:
 
         # In-text citations (author-year)
         in_text_examples: List[str] = []
-        for m in re.finditer(self.IN_TEXT_PATTERN, text):
+        for m in self.IN_TEXT_PATTERN.finditer(text):
             if len(in_text_examples) >= 5:
                 break
             in_text_examples.append(m.group(0))
-        in_text_count = len(re.findall(self.IN_TEXT_PATTERN, text))
+        in_text_count = len(self.IN_TEXT_PATTERN.findall(text))
 
         # Bracket citations [12], [3,4]
         bracket_examples: List[str] = []
         bracket_count = 0
-        for m in re.finditer(self.BRACKET_PATTERN, text):
-            nums = re.findall(r"\d+", m.group(1))
+        for m in self.BRACKET_PATTERN.finditer(text):
+            nums = self.NUMBER_PATTERN.findall(m.group(1))
             bracket_count += len(nums)
             if len(bracket_examples) < 5:
                 bracket_examples.append(m.group(0))
@@ -3,6 +3,8 @@
 import re
 from typing import Dict, Any, List
 
+from Core.ingestion.text_view import TextView
+
 
 class EthicsGuard:
     """
@@ -126,8 +128,9 @@ class EthicsGuard:
                     examples.append(term)
         return {"count": count, "examples": examples}
 
-    def analyze(self, text: str) -> Dict[str, Any]:
-        if not text.strip():
+    def analyze(self, text: str | TextView) -> Dict[str, Any]:
+        view = TextView.of(text)
+        if view.is_blank:
             # Completely empty / whitespace -> no signal, zero risk.
             return {
                 "has_human_subjects": False,
@@ -139,7 +142,7 @@ class EthicsGuard:
                 "overall_ethics_risk_score": 0.0,
             }
 
-        lowered = text.lower()
+        lowered = view.lower
 
         has_human_subjects = self._contains_any(lowered, self.HUMAN_SUBJECT_TERMS)
         has_vulnerable = self._contains_any(lowered, self.VULNERABLE_TERMS)
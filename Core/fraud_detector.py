@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from typing import Dict, Any, List
 
+from Core.ingestion.text_view import TextView
+
 
 class FraudDetector:
     """
@@ -34,12 +36,12 @@ class FraudDetector:
 
     _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 
-    def analyze_fraud(self, text: str) -> Dict[str, Any]:
-        text = text or ""
-        lowered = text.lower().strip()
+    def analyze_fraud(self, text: str | TextView) -> Dict[str, Any]:
+        view = TextView.of(text or "")
+        text = view.text
 
         # Empty text: perfectly clean
-        if not lowered:
+        if view.is_blank:
             return {
                 "overall_fraud_suspicion_score": 0.0,
                 "impossible_p_values": {"count": 0, "examples": []},
@@ -55,6 +57,8 @@ class FraudDetector:
                 "suspiciousness_score": 0.0,  # legacy alias
             }
 
+        lowered = view.lower
+
         # ---- Your existing signals (kept) ----
         refuses_data_sharing = any(
             phrase in lowered
@@ -118,32 +122,25 @@ class FraudDetector:
         # ---- Option A buckets ----
 
         # 1) impossible_p_values (very basic: flag p < 0 or > 1 if present)
+        # 2) suspicious_p_clustering (p in [0.045, 0.05])
+        # Both come from a single scan over the reported p-values.
         impossible: List[str] = []
+        cluster_examples: List[str] = []
+        p_count = 0
         for m in self._P_VALUE_RE.finditer(text):
-            raw = m.group(0).strip()
             try:
                 v = float(m.group("val"))
             except ValueError:
                 continue
+            p_count += 1
             if v < 0.0 or v > 1.0:
-                impossible.append(raw)
+                impossible.append(m.group(0).strip())
+            if 0.045 <= v <= 0.05 and len(cluster_examples) < 10:
+                cluster_examples.append(m.group(0).strip())
 
         impossible_p_values = {"count": len(impossible), "examples": impossible[:10]}
 
-        # 2) suspicious_p_clustering (p in [0.045, 0.05])
-        all_p_vals: List[float] = []
-        cluster_examples: List[str] = []
-        for m in self._P_VALUE_RE.finditer(text):
-            raw = m.group(0).strip()
-            try:
-                v = float(m.group("val"))
-            except ValueError:
-                continue
-            all_p_vals.append(v)
-            if 0.045 <= v <= 0.05 and len(cluster_examples) < 10:
-                cluster_examples.append(raw)
-
-        cluster_ratio = (len(cluster_examples) / max(len(all_p_vals), 1)) if all_p_vals else 0.0
+        cluster_ratio = (len(cluster_examples) / p_count) if p_count else 0.0
         suspicious_p_clustering = {
             "count": len(cluster_examples),
             "cluster_ratio": float(cluster_ratio),
@@ -214,5 +211,5 @@ class FraudDetector:
             "suspiciousness_score": overall,  # legacy alias (keeps your existing tests happy if any rely on it)
         }
 
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def analyze(self, text: str | TextView) -> Dict[str, Any]:
         return self.analyze_fraud(text)
@@ -3,6 +3,7 @@ from .document import Document
 from .ingestor import DocumentIngestor
 from .sectionizer import Section, Sectionizer
 from .text_cleaner import CleanedText, TextCleaner
+from .text_view import TextView
 
 __all__ = [
     "Document",
@@ -11,4 +12,5 @@ __all__ = [
     "Sectionizer",
     "CleanedText",
     "TextCleaner",
+    "TextView",
 ]
\ No newline at end of file
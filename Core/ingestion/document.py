@@ -8,7 +8,7 @@ from typing import List, Dict, Any
 from Core.ingestion.sectionizer import Section
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Document:
     """
     Canonical ingested document used throughout Nobias_AI.
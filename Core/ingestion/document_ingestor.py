@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 from Utils.file_loader import load_paper
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Document:
     """
     Canonical representation of an ingested document.
@@ -1,7 +1,11 @@
 # Core/ingestion/ingestor.py
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
 from Core.ingestion.document import Document
 from Core.ingestion.sectionizer import Sectionizer
 from Core.ingestion.text_cleaner import TextCleaner
@@ -11,34 +15,99 @@ from Utils.file_loader import load_paper
 class DocumentIngestor:
     """
     Advanced ingestor with figure/table detection.
+
+    Recently ingested documents are cached: files by (path, mtime, size),
+    uploads by content digest. Document is frozen, so a cached instance is
+    shared between callers.
     """
+    # Number of recently ingested documents kept.
+    _CACHE_SIZE = 16
+
     def __init__(self) -> None:
         self._cleaner = TextCleaner()
         self._sectionizer = Sectionizer()
+        self._cache: OrderedDict[Tuple[Any, ...], Document] = OrderedDict()
 
     def ingest(self, path: Path) -> Document:
-        if not path.exists():
-            raise FileNotFoundError(f"Document not found: {path}")
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Document not found: {path}") from None
 
-        raw_text = load_paper(str(path))
-        cleaned = self._cleaner.clean(raw_text)
-        clean_text = cleaned.clean_text
-        sections = self._sectionizer.split(clean_text)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        return self._cached(key, lambda: self._ingest_path(path, st.st_size))
+
+    def ingest_bytes(self, data: bytes, filename: str) -> Document:
+        """
+        Ingest an in-memory upload without writing it to disk first.
+        `filename` only supplies the name and type (by suffix).
+        """
+        key = (filename, hashlib.blake2b(data, digest_size=16).digest())
+        return self._cached(key, lambda: self._ingest_data(data, filename))
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _cached(self, key: Tuple[Any, ...], build: Callable[[], Document]) -> Document:
+        # pop + re-insert (not get + move_to_end): the ingestor may be shared
+        # by threads (Streamlit sessions) and another one may evict the key.
+        doc = self._cache.pop(key, None)
+        if doc is None:
+            doc = build()
+        self._cache[key] = doc
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return doc
 
-        # Advanced extraction if PDF
-        figures = []
-        tables = []
+    def _ingest_path(self, path: Path, byte_size: int) -> Document:
+        figures: List[Dict[str, Any]] = []
+        tables: List[Dict[str, Any]] = []
         page_count = 0
         if path.suffix.lower() == ".pdf":
-            extractor = AdvancedPDFExtractor(path)
-            data = extractor.extract_all()
-            figures = data["figures"]
-            tables = data["tables"]
-            page_count = data["page_count"]
-            extractor.close()
+            # One open, one pass over the pages for text, figures and tables
+            with AdvancedPDFExtractor(path) as extractor:
+                extracted = extractor.extract_all()
+            raw_text = extracted["text"]
+            figures = extracted["figures"]
+            tables = extracted["tables"]
+            page_count = extracted["page_count"]
+        else:
+            raw_text = load_paper(str(path))
+
+        return self._build(path, byte_size, raw_text, figures, tables, page_count)
+
+    def _ingest_data(self, data: bytes, filename: str) -> Document:
+        path = Path(filename)
+        figures: List[Dict[str, Any]] = []
+        tables: List[Dict[str, Any]] = []
+        page_count = 0
+        if path.suffix.lower() == ".pdf":
+            with AdvancedPDFExtractor(path, stream=data) as extractor:
+                extracted = extractor.extract_all()
+            raw_text = extracted["text"]
+            figures = extracted["figures"]
+            tables = extracted["tables"]
+            page_count = extracted["page_count"]
+        else:
+            # Same decoding as load_paper's text-file fallback
+            raw_text = data.decode("utf-8", errors="ignore")
+
+        return self._build(path, len(data), raw_text, figures, tables, page_count)
+
+    def _build(
+        self,
+        path: Path,
+        byte_size: int,
+        raw_text: str,
+        figures: List[Dict[str, Any]],
+        tables: List[Dict[str, Any]],
+        page_count: int,
+    ) -> Document:
+        cleaned = self._cleaner.clean(raw_text)
+        clean_text = cleaned.clean_text
+        sections = self._sectionizer.split(clean_text)
 
         doc_type = path.suffix.lower().lstrip(".") or "unknown"
-        byte_size = path.stat().st_size
         char_count = len(clean_text)
 
         return Document(
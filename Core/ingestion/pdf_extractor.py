@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-import fitz  # PyMuPDF
 
 
 class PDFExtractor:
@@ -20,6 +19,8 @@ class PDFExtractor:
         if not path.exists():
             raise FileNotFoundError(f"PDF not found: {path}")
 
+        import fitz  # PyMuPDF; deferred so importing Core stays cheap
+
         text_chunks: list[str] = []
 
         with fitz.open(path) as doc:
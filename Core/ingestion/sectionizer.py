@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Iterable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Section:
     name: str
     start: int
@@ -47,6 +47,10 @@ class Sectionizer:
         "bibliography",
     )
 
+    # One line at a time, newline included (the last line may lack one)
+    _LINE_RE = re.compile(r".*?(?:\n|$)")
+    _NUMBERING_RE = re.compile(r"^\s*(\d+(?:\.\d+)*|[IVXLC]+)\s*[.)]\s*", re.IGNORECASE)
+
     def split(self, text: str) -> list[Section]:
         if not text.strip():
             return [Section(name="full_text", start=0, end=0, text="")]
@@ -98,7 +102,7 @@ class Sectionizer:
     @staticmethod
     def _iter_lines_with_offsets(text: str) -> Iterable[tuple[str, int, int]]:
         start = 0
-        for m in re.finditer(r".*?(?:\n|$)", text):
+        for m in Sectionizer._LINE_RE.finditer(text):
             line = m.group(0)
             end = start + len(line)
             yield line.rstrip("\n"), start, end
@@ -110,12 +114,7 @@ class Sectionizer:
             return None
 
         # Remove numbering like "1. Introduction", "2) Methods", "III RESULTS"
-        raw = re.sub(
-            r"^\s*(\d+(?:\.\d+)*|[IVXLC]+)\s*[.)]\s*",
-            "",
-            raw,
-            flags=re.IGNORECASE,
-        )
+        raw = self._NUMBERING_RE.sub("", raw)
 
         raw = raw.rstrip(" :.\t").strip()
 
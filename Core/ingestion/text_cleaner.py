@@ -6,7 +6,7 @@ import re
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CleanedText:
     raw_text: str
     clean_text: str
@@ -22,7 +22,10 @@ class TextCleaner:
       - keep content intact (avoid aggressive rewriting)
     """
 
-    _HYPHEN_LINEBREAK_RE = re.compile(r"(\w)-\n(\w)")
+    # Hyphenated line break. Anchored on the literal "-\n": a leading (\w) made
+    # the engine attempt a match at nearly every character of the paper.
+    _HYPHEN_LINEBREAK_RE = re.compile(r"-\n(?=\w)")
+    _WORD_CHAR_RE = re.compile(r"\w")
     _MULTI_SPACE_RE = re.compile(r"[ \t]{2,}")
     _MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
 
@@ -34,7 +37,7 @@ class TextCleaner:
         text = text.replace("\r\n", "\n").replace("\r", "\n")
 
         # Fix hyphenation across line breaks: "inter-\national" -> "international"
-        text = TextCleaner._HYPHEN_LINEBREAK_RE.sub(r"\1\2", text)
+        text = TextCleaner._join_hyphenated(text)
 
         # Collapse excessive spaces/tabs
         text = TextCleaner._MULTI_SPACE_RE.sub(" ", text)
@@ -49,3 +52,21 @@ class TextCleaner:
         cleaned = text.strip()
 
         return CleanedText(raw_text=raw_text or "", clean_text=cleaned)
+
+    @staticmethod
+    def _join_hyphenated(text: str) -> str:
+        r"""
+        Same result as re.sub(r"(\w)-\n(\w)", r"\1\2", text): drop "-\n" between
+        two word characters, where a word character joined by one break can't
+        start the next (as in "a-\nb-\nc" -> "ab-\nc").
+        """
+        pieces = []
+        start = 0
+        consumed = -1  # index of the last word character used after a break
+        for m in TextCleaner._HYPHEN_LINEBREAK_RE.finditer(text):
+            before = m.start() - 1
+            if before > consumed and TextCleaner._WORD_CHAR_RE.match(text, before):
+                pieces.append(text[start:m.start()])
+                start = consumed = m.end()
+        pieces.append(text[start:])
+        return "".join(pieces)
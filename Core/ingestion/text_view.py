@@ -0,0 +1,51 @@
+# Core/ingestion/text_view.py
+
+from __future__ import annotations
+
+from typing import List
+
+
+class TextView:
+    """
+    A paper's text plus the derived forms the analyzers share.
+
+    Each form is computed on first access and then reused by every analyzer
+    that receives the same view during a review. Pickling (process-pool
+    workers) ships only the text.
+    """
+
+    __slots__ = ("text", "_lower", "_words")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._lower: str | None = None
+        self._words: List[str] | None = None
+
+    @classmethod
+    def of(cls, text: str | TextView) -> TextView:
+        return text if isinstance(text, TextView) else cls(text)
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def words(self) -> List[str]:
+        """Whitespace-separated words (str.split())."""
+        if self._words is None:
+            self._words = self.text.split()
+        return self._words
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def is_blank(self) -> bool:
+        """Same as `not text.strip()`, without copying the text."""
+        return not self.text or self.text.isspace()
+
+    def __reduce__(self):
+        return (TextView, (self.text,))
@@ -2,6 +2,7 @@
 import re
 from typing import Dict
 
+from Core.ingestion.text_view import TextView
 from Utils.math_utils import MathDetector
 
 
@@ -9,15 +10,19 @@ class IntegrityVerifier:
     """
     Expanded integrity checker: length, structure, math density, self-consistency signals.
     """
+    SECTION_PATTERN = re.compile(r"introduction|methods|results|discussion|conclusion", re.IGNORECASE)
+
     def __init__(self):
         self.math_detector = MathDetector()
 
-    def check_basic_integrity(self, paper_text: str) -> Dict:
+    def check_basic_integrity(self, paper_text: str | TextView) -> Dict:
+        view = TextView.of(paper_text)
+        paper_text = view.text
         stripped = paper_text.strip()
-        word_count = len(stripped.split()) if stripped else 0
+        word_count = view.word_count
         char_count = len(stripped)
-        has_sections = bool(re.search(r"introduction|methods|results|discussion|conclusion", stripped, re.IGNORECASE))
-        math_analysis = self.math_detector.analyze(paper_text)
+        has_sections = bool(self.SECTION_PATTERN.search(stripped))
+        math_analysis = self.math_detector.analyze(paper_text, word_count=word_count)
 
         return {
             "is_empty": word_count == 0,
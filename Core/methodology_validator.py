@@ -4,6 +4,8 @@ import re
 from statistics import mean
 from typing import Dict, List
 
+from Core.ingestion.text_view import TextView
+
 
 class MethodologyValidator:
     """
@@ -18,8 +20,10 @@ class MethodologyValidator:
     Returns a structured summary and an overall methodology score in [0, 1].
     """
 
-    def analyze(self, text: str) -> Dict:
-        lowered = text.lower()
+    SAMPLE_SIZE_PATTERN = re.compile(r"\b[nsn]\s*=\s*(\d{1,5})", re.IGNORECASE)
+
+    def analyze(self, text: str | TextView) -> Dict:
+        lowered = TextView.of(text).lower
 
         design_hits = self._find_design_terms(lowered)
         sample_info = self._extract_sample_sizes(lowered)
@@ -130,8 +134,7 @@ class MethodologyValidator:
         """
         Looks for 'n = 120', 'N=35', etc. and returns list of ints.
         """
-        pattern = re.compile(r"\b[nsn]\s*=\s*(\d{1,5})", re.IGNORECASE)
-        matches = pattern.findall(lowered)
+        matches = self.SAMPLE_SIZE_PATTERN.findall(lowered)
         values: List[int] = []
         for m in matches:
             try:
@@ -4,6 +4,8 @@ import re
 from collections import Counter
 from typing import Dict, Any, List
 
+from Core.ingestion.text_view import TextView
+
 
 class PlagiarismChecker:
     """
@@ -17,17 +19,21 @@ class PlagiarismChecker:
     It produces a bounded suspicion score in [0, 1].
     """
 
-    def _normalize_tokens(self, text: str) -> List[str]:
+    TOKEN_PATTERN = re.compile(r"[A-Za-z0-9']+")
+    SENTENCE_END_PATTERN = re.compile(r"[.!?]+")
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
+    def _normalize_tokens(self, text: str | TextView) -> List[str]:
         # Lowercase and keep only alphanumeric-ish tokens
-        tokens = re.findall(r"[A-Za-z0-9']+", text.lower())
+        tokens = self.TOKEN_PATTERN.findall(TextView.of(text).lower)
         return tokens
 
     def _split_sentences(self, text: str) -> List[str]:
         # Very crude sentence splitter
-        raw = re.split(r"[.!?]+", text)
+        raw = self.SENTENCE_END_PATTERN.split(text)
         sentences = []
         for s in raw:
-            s_norm = re.sub(r"\s+", " ", s.strip())
+            s_norm = self.WHITESPACE_PATTERN.sub(" ", s.strip())
             if len(s_norm) > 0:
                 sentences.append(s_norm)
         return sentences
@@ -41,15 +47,13 @@ class PlagiarismChecker:
                 "top": [],
             }
 
-        ngrams = [
-            " ".join(tokens[i : i + n]) for i in range(len(tokens) - n + 1)
-        ]
-        counts = Counter(ngrams)
-        total = len(ngrams)
+        # Count token tuples; only the top few are joined back into strings.
+        counts = Counter(zip(*(tokens[i:] for i in range(n))))
+        total = len(tokens) - n + 1
         unique = len(counts)
         max_freq = max(counts.values()) if counts else 0
 
-        top = [ng for ng, _ in counts.most_common(5)]
+        top = [" ".join(ng) for ng, _ in counts.most_common(5)]
 
         return {
             "total": total,
@@ -78,7 +82,7 @@ class PlagiarismChecker:
             "top_repeated": top_repeated,
         }
 
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def analyze(self, text: str | TextView) -> Dict[str, Any]:
         """
         Analyze redundancy / reuse patterns and return:
 
@@ -89,7 +93,8 @@ class PlagiarismChecker:
             - top_repeated_sentences
             - overall_plagiarism_suspicion_score (0-1)
         """
-        if not text.strip():
+        view = TextView.of(text)
+        if view.is_blank:
             return {
                 "ngram_repetition_ratio": 0.0,
                 "highest_ngram_frequency": 0,
@@ -99,8 +104,8 @@ class PlagiarismChecker:
                 "overall_plagiarism_suspicion_score": 0.0,
             }
 
-        tokens = self._normalize_tokens(text)
-        sentences = self._split_sentences(text)
+        tokens = self._normalize_tokens(view)
+        sentences = self._split_sentences(view.text)
 
         ngram_info = self._ngram_stats(tokens, n=5)
         sent_info = self._sentence_redundancy(sentences)
@@ -23,5 +23,12 @@ class ReasoningTrace:
             step["confidence"] = round(confidence, 3)
         self._steps.append(step)
 
+    def clear(self) -> None:
+        """
+        Start a fresh trace. Rebinds rather than emptying in place, since
+        export() hands the live list to callers and earlier results keep it.
+        """
+        self._steps = []
+
     def export(self) -> List[Dict[str, Any]]:
         return self._steps
\ No newline at end of file
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Dict, Any, Optional
 
+from Core.ingestion.text_view import TextView
+
 
 class ReplicationSimulator:
     """
@@ -23,7 +25,7 @@ class ReplicationSimulator:
 
     def analyze_replication(
         self,
-        text: str,
+        text: str | TextView,
         stats: Optional[Dict[str, Any]] = None,
         methodology: Optional[Dict[str, Any]] = None,
         citations: Optional[Dict[str, Any]] = None,
@@ -33,10 +35,11 @@ class ReplicationSimulator:
         methodology = methodology or {}
         citations = citations or {}
 
-        lowered = (text or "").lower().strip()
+        view = TextView.of(text or "")
+        lowered = view.lower
 
         # ---- Empty text defaults ----
-        if not lowered:
+        if view.is_blank:
             return {
                 "overall_replicability_score": 0.0,
                 "simulated_replication_outcome": "uncertain",
@@ -170,5 +173,5 @@ class ReplicationSimulator:
             "overall_replication_score": overall,  # legacy alias
         }
 
-    def analyze(self, text: str, **kwargs: Any) -> Dict[str, Any]:
+    def analyze(self, text: str | TextView, **kwargs: Any) -> Dict[str, Any]:
         return self.analyze_replication(text, **kwargs)
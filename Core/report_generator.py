@@ -1,9 +1,43 @@
 # Core/report_generator.py
 from __future__ import annotations
+import pickle
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 
+# Static section headers and score legends shared by every report.
+_HDR_FINAL = "## Final Verdict\n"
+_HDR_REASONS = "### Key Reasons"
+_HDR_SUMMARY = "## Summary Scores\n"
+_HDR_BIAS = "## Bias & Language\n"
+_HDR_STATS = "## Statistical Rigor\n"
+_HDR_METHODOLOGY = "## Methodology & Design\n"
+_HDR_REPLICATION = "## Replicability & Robustness\n"
+_HDR_CITATIONS = "## Citations & References\n"
+_HDR_PLAGIARISM = "## Plagiarism / Redundancy Signals\n"
+_HDR_FRAUD = "## Fraud / Anomaly Signals\n"
+_HDR_ETHICS = "## Ethics & Safety\n"
+_HDR_INTEGRITY = "## Integrity Checks\n"
+_HDR_HALLUCINATION = "## Self-Audit: Hallucination & Overconfidence Check\n"
+_HDR_HALLUCINATION_FINDINGS = "### Key Findings Across Modules"
+_HDR_TRACE = "## Reasoning Trace (first steps)\n"
+
+_LEG_BIAS = "(0 = neutral, 1 = highly biased)"
+_LEG_STATS = "(0 = none, 1 = high)"
+_LEG_STRENGTH = "(0 = weak, 1 = strong)"
+_LEG_PLAGIARISM = "(0 = clean, 1 = highly repetitive)"
+_LEG_FRAUD = "(0 = clean, 1 = highly suspicious)"
+_LEG_ETHICS = "(0 = low risk, 1 = high risk)"
+
+
+def _fmt_step(step: dict[str, Any]) -> str:
+    """Render one reasoning-trace step (plus its metadata line, if any)."""
+    base = f"- **[{step['tag']}]** `{step['timestamp']}` – {step['description']}"
+    metadata = step.get("metadata")
+    return base if metadata is None else f"{base}\n - metadata: `{metadata}`"
+
+
 class ReportGenerator:
     """
     Generates human-readable review reports (Markdown) from the Nobias
@@ -13,11 +47,43 @@ class ReportGenerator:
       - replication
       - final_verdict
     """
+    # Number of rendered reports kept for re-renders of an unchanged result.
+    _CACHE_SIZE = 32
+
     def __init__(self, output_dir: str | Path = "reports") -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
 
     def generate_markdown(self, paper_name: str, result: dict[str, Any]) -> str:
+        key = self._cache_key(paper_name, result)
+        if key is None:
+            return self._render_markdown(paper_name, result)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        md = self._render_markdown(paper_name, result)
+        self._cache[key] = md
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return md
+
+    @staticmethod
+    def _cache_key(paper_name: str, result: dict[str, Any]) -> bytes | None:
+        """
+        Exact encoding of a (paper_name, result) pair, or None if it has no
+        pickle form. Pickle keeps everything the render can see through repr
+        (tuple vs list, 1 vs "1" keys, key order), and the bytes themselves
+        are the key, so a hit is always the same content.
+        """
+        try:
+            return pickle.dumps((paper_name, result), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+
+    def _render_markdown(self, paper_name: str, result: dict[str, Any]) -> str:
         integrity: dict[str, Any] = result["integrity"]
         bias: dict[str, Any] = result["bias"]
         stats: dict[str, Any] = result["statistics"]
@@ -37,18 +103,29 @@ class ReportGenerator:
         emo: dict[str, Any] = bias["emotional_language"]
         auth: dict[str, Any] = bias["authority_appeals"]
         cert: dict[str, Any] = bias["certainty_language"]
+        emo_examples = emo["examples"][:5]
+        auth_examples = auth["examples"][:5]
+        cert_examples = cert["examples"][:5]
         stats_rigor = float(stats["overall_rigor_score"])
         has_stats = bool(stats["has_statistical_content"])
+        p_values: dict[str, Any] = stats["p_values"]
+        conf_intervals: dict[str, Any] = stats["confidence_intervals"]
         meth_score = float(meth["overall_methodology_score"])
-        sample_sizes = meth["sample_size"]["values"]
-        small_sample_warning = bool(meth["sample_size"]["small_sample_warning"])
+        sample_size: dict[str, Any] = meth["sample_size"]
+        transparency: dict[str, Any] = meth["transparency"]
+        sample_sizes = sample_size["values"]
+        small_sample_warning = bool(sample_size["small_sample_warning"])
         has_control = bool(meth["control_and_blinding"]["has_control_group"])
         has_randomization = bool(meth["design"]["has_randomization"])
-        has_preregistration = bool(meth["transparency"]["has_preregistration"])
-        has_data_sharing = bool(meth["transparency"]["has_data_sharing"])
+        has_preregistration = bool(transparency["has_preregistration"])
+        has_data_sharing = bool(transparency["has_data_sharing"])
         has_ref_section = bool(citations["has_references_section"])
         est_ref_count = int(citations["estimated_reference_count"])
         cit_score = float(citations["overall_citation_quality_score"])
+        doi: dict[str, Any] = citations["doi"]
+        urls: dict[str, Any] = citations["urls"]
+        in_text: dict[str, Any] = citations["in_text_citations"]
+        bracket: dict[str, Any] = citations["bracket_citations"]
         plag_score = float(plag["overall_plagiarism_suspicion_score"])
         ngram_rep = float(plag["ngram_repetition_ratio"])
         sent_rep = float(plag["repeated_sentence_ratio"])
@@ -75,185 +152,131 @@ class ReportGenerator:
         std_dev = float(final_verdict.get("trust_std_dev", 0.0))
         ci = final_verdict.get("trust_95_confidence_interval", [trust_score, trust_score])
         verdict_label = str(final_verdict["verdict_label"])
-        reasons_raw = final_verdict["reasons"]
-        reasons: list[str] = [str(r) for r in reasons_raw]
-
-        lines: list[str] = []
-        def _add(*items: str) -> None:
-            lines.extend(items)
-
-        _add(f"# Nobias AI Peer Review – {paper_name}\n")
-
-        # === Final Verdict with Uncertainty ===
-        _add("## Final Verdict\n")
-        _add(f"- **Verdict**: **{verdict_label}**")
-        _add(f"- **Trust score**: `{trust_score:.3f} ± {std_dev:.3f}` (95% CI: `{ci[0]:.3f}–{ci[1]:.3f}`)")
-        _add("")
-        _add("### Key Reasons")
-        for r in reasons[:5]:
-            _add(f"- {r}")
-        _add("")
-
-        # High-level snapshot
-        _add(
-            "## Summary Scores\n",
-            f"- **Bias score**: `{bias_score:.3f}` (0 = neutral, 1 = highly biased)",
-            f"- **Statistical rigor score**: `{stats_rigor:.3f}` (0 = none, 1 = high)",
-            f"- **Methodology score**: `{meth_score:.3f}` (0 = weak, 1 = strong)",
-            f"- **Citation quality score**: `{cit_score:.3f}` (0 = weak, 1 = strong)",
-            f"- **Plagiarism / redundancy suspicion score**: `{plag_score:.3f}` (0 = clean, 1 = highly repetitive)",
-            f"- **Fraud / anomaly suspicion score**: `{fraud_score:.3f}` (0 = clean, 1 = highly suspicious)",
-            f"- **Ethics / safety risk score**: `{ethics_score:.3f}` (0 = low risk, 1 = high risk)",
-            f"- **Replicability score**: `{replication_score:.3f}` (outcome: `{simulated_outcome}`)",
-            f"- **Word count**: `{word_count}` (passes minimum length: `{passes_min_len}`)",
-            "",
-        )
-
-        # === All other sections remain exactly as you had them ===
-        # Bias detail
-        _add(
-            "## Bias & Language\n",
-            f"- Emotional language density: `{float(emo['density']):.4f}` (examples: {emo['examples'][:5]})",
-            f"- Authority appeals density: `{float(auth['density']):.4f}` (examples: {auth['examples'][:5]})",
-            f"- Certainty language density: `{float(cert['density']):.4f}` (examples: {cert['examples'][:5]})",
-            "",
-        )
-
-        # Statistical Rigor
-        _add(
-            "## Statistical Rigor\n",
-            f"- Has statistical content: `{has_stats}`",
-            f"- P-value count: `{int(stats['p_values']['count'])}` (examples: {stats['p_values']['examples']})",
-            f"- Confidence interval count: `{int(stats['confidence_intervals']['count'])}` (examples: {stats['confidence_intervals']['examples']})",
-            f"- Detected tests: {stats['tests']}",
-            f"- Effect size / power terms: {stats['effect_terms']}",
-            "",
-        )
-
-        # Methodology & Design
-        _add(
-            "## Methodology & Design\n",
-            f"- Sample sizes detected: {sample_sizes}",
-            f"- Small-sample warning: `{small_sample_warning}`",
-            f"- Has control group: `{has_control}`",
-            f"- Has randomization: `{has_randomization}`",
-            f"- Has preregistration: `{has_preregistration}`",
-            f"- Has data sharing: `{has_data_sharing}`",
-            "",
-        )
-
-        # Replicability & Robustness
-        _add(
-            "## Replicability & Robustness\n",
-            f"- Overall replicability score: `{replication_score:.3f}` (simulated outcome: `{simulated_outcome}`)",
-            f"- Replication claims: `{bool(claims['has_replication_claims'])}`",
-            f"- Robustness: bootstrap=`{bool(robustness['mentions_bootstrap'])}`, "
-            f"monte_carlo=`{bool(robustness['mentions_monte_carlo'])}`, "
-            f"sensitivity=`{bool(robustness['mentions_sensitivity_analysis'])}`",
-            f"- Openness: open_data=`{bool(openness['has_open_data'])}`, "
-            f"open_code=`{bool(openness['has_open_code'])}`, "
-            f"preregistration=`{bool(openness['has_preregistration'])}`",
-            "",
-        )
-
-        # Citations & References
-        _add(
-            "## Citations & References\n",
-            f"- Has references section: `{has_ref_section}`",
-            f"- Estimated reference count: `{est_ref_count}`",
-            f"- DOI count: `{int(citations['doi']['count'])}` (examples: {citations['doi']['examples']})",
-            f"- URL count: `{int(citations['urls']['count'])}` (examples: {citations['urls']['examples']})",
-            f"- In-text citation count: `{int(citations['in_text_citations']['count'])}` (examples: {citations['in_text_citations']['examples']})",
-            f"- Bracket citation count: `{int(citations['bracket_citations']['count'])}` (examples: {citations['bracket_citations']['examples']})",
-            f"- Overall citation quality score: `{cit_score:.3f}`",
-            "",
-        )
-
-        # Plagiarism / Redundancy Signals
-        _add(
-            "## Plagiarism / Redundancy Signals\n",
-            f"- Overall suspicion score: `{plag_score:.3f}` (0 = clean, 1 = highly repetitive)",
-            f"- N-gram repetition ratio (5-grams): `{ngram_rep:.4f}`",
-            f"- Repeated sentence ratio: `{sent_rep:.4f}`",
-            f"- Top repeated 5-grams: {plag['top_repeated_ngrams']}",
-            f"- Top repeated sentences: {plag['top_repeated_sentences']}",
-            "",
-        )
-
-        # Fraud / Anomaly Signals
-        _add(
-            "## Fraud / Anomaly Signals\n",
-            f"- Overall fraud / anomaly suspicion score: `{fraud_score:.3f}` (0 = clean, 1 = highly suspicious)",
-            f"- Impossible or extreme p-values: `{int(impossible_p['count'])}` (examples: {impossible_p['examples']})",
-            f"- p-values clustered just below 0.05: `{int(cluster['count'])}` "
-            f"(cluster ratio: `{float(cluster['cluster_ratio']):.4f}`) (examples: {cluster['examples']})",
-            f"- Extreme effect language occurrences: `{int(extreme_lang['count'])}` (examples: {extreme_lang['examples']})",
-            f"- Suspected mismatched p-text sentences: `{int(mismatch['count'])}` (examples: {mismatch['examples']})",
-            "",
-        )
-
-        # Ethics & Safety
-        _add(
-            "## Ethics & Safety\n",
-            f"- Overall ethics / safety risk score: `{ethics_score:.3f}` (0 = low risk, 1 = high risk)",
-            f"- Overall ethics / safety risk score: `{ethics_score:.3f}` (0 = low risk, 1 = high risk)",
-            f"- Has human subjects: `{has_human_subjects}`",
-            f"- Has vulnerable population: `{has_vulnerable}`",
-            f"- Mentions ethics approval / IRB: `{has_ethics_approval}`",
-            f"- Mentions informed consent: `{has_consent}`",
-            f"- Mentions data protection / privacy: `{has_data_protection}`",
-            f"- High-risk / dual-use terms: `{int(risk_terms['count'])}` (examples: {risk_terms['examples']})",
-            "",
-        )
-
-        # Integrity Checks
-        _add(
-            "## Integrity Checks\n",
-            f"- Is empty: `{bool(integrity['is_empty'])}`",
-            f"- Word count: `{word_count}`",
-            f"- Passes minimum word length threshold: `{passes_min_len}`",
-            "",
-        )
-
-        # === Hallucination Self-Audit ===
+        reasons: list[str] = [str(r) for r in final_verdict["reasons"][:5]]
+
+        # === Variable-length blocks ===
+        reasons_block = "".join([f"\n- {r}" for r in reasons])
+
         hallucination_overall = result.get("hallucination_audit", {})
         hallucination_details = result.get("hallucination_details", [])
-        _add("## Self-Audit: Hallucination & Overconfidence Check\n")
         risk = hallucination_overall.get("overall_hallucination_risk", 0.0)
         passed = hallucination_overall.get("passed_all_audits", True)
-        _add(f"- **Overall hallucination risk score**: `{risk:.4f}` (lower = more trustworthy)")
-        _add(f"- **Passed all self-audits**: `{passed}`")
-        _add(f"- **Total potential issues flagged**: `{hallucination_overall.get('total_findings', 0)}`\n")
-
         if hallucination_details:
-            _add("### Key Findings Across Modules")
-            for audit in hallucination_details[:5]:
-                module = audit["module"]
-                findings = audit["findings_count"]
-                high = audit["high_severity_count"]
-                _add(f"- **{module.capitalize()} module**: {findings} issues ({high} high-severity)")
+            findings_block = _HDR_HALLUCINATION_FINDINGS + "".join([
+                f"\n- **{audit['module'].capitalize()} module**: {audit['findings_count']} issues "
+                f"({audit['high_severity_count']} high-severity)"
+                for audit in hallucination_details[:5]
+            ])
             if len(hallucination_details) > 5:
-                _add("- (Additional modules audited — full details in trace)")
-            _add("")
+                findings_block += "\n- (Additional modules audited — full details in trace)"
+            findings_block += "\n"
         else:
-            _add("- No high-risk claims or contradictions detected across modules.\n")
+            findings_block = "- No high-risk claims or contradictions detected across modules.\n"
+
+        trace_block = "\n" + "\n".join([_fmt_step(step) for step in trace[:10]]) if trace else ""
+
+        return f"""\
+# Nobias AI Peer Review – {paper_name}
+
+{_HDR_FINAL}
+- **Verdict**: **{verdict_label}**
+- **Trust score**: `{trust_score:.3f} ± {std_dev:.3f}` (95% CI: `{ci[0]:.3f}–{ci[1]:.3f}`)
+
+{_HDR_REASONS}{reasons_block}
+
+{_HDR_SUMMARY}
+- **Bias score**: `{bias_score:.3f}` {_LEG_BIAS}
+- **Statistical rigor score**: `{stats_rigor:.3f}` {_LEG_STATS}
+- **Methodology score**: `{meth_score:.3f}` {_LEG_STRENGTH}
+- **Citation quality score**: `{cit_score:.3f}` {_LEG_STRENGTH}
+- **Plagiarism / redundancy suspicion score**: `{plag_score:.3f}` {_LEG_PLAGIARISM}
+- **Fraud / anomaly suspicion score**: `{fraud_score:.3f}` {_LEG_FRAUD}
+- **Ethics / safety risk score**: `{ethics_score:.3f}` {_LEG_ETHICS}
+- **Replicability score**: `{replication_score:.3f}` (outcome: `{simulated_outcome}`)
+- **Word count**: `{word_count}` (passes minimum length: `{passes_min_len}`)
+
+{_HDR_BIAS}
+- Emotional language density: `{float(emo['density']):.4f}` (examples: {emo_examples})
+- Authority appeals density: `{float(auth['density']):.4f}` (examples: {auth_examples})
+- Certainty language density: `{float(cert['density']):.4f}` (examples: {cert_examples})
+
+{_HDR_STATS}
+- Has statistical content: `{has_stats}`
+- P-value count: `{int(p_values['count'])}` (examples: {p_values['examples']})
+- Confidence interval count: `{int(conf_intervals['count'])}` (examples: {conf_intervals['examples']})
+- Detected tests: {stats['tests']}
+- Effect size / power terms: {stats['effect_terms']}
+
+{_HDR_METHODOLOGY}
+- Sample sizes detected: {sample_sizes}
+- Small-sample warning: `{small_sample_warning}`
+- Has control group: `{has_control}`
+- Has randomization: `{has_randomization}`
+- Has preregistration: `{has_preregistration}`
+- Has data sharing: `{has_data_sharing}`
+
+{_HDR_REPLICATION}
+- Overall replicability score: `{replication_score:.3f}` (simulated outcome: `{simulated_outcome}`)
+- Replication claims: `{bool(claims['has_replication_claims'])}`
+- Robustness: bootstrap=`{bool(robustness['mentions_bootstrap'])}`, \
+monte_carlo=`{bool(robustness['mentions_monte_carlo'])}`, \
+sensitivity=`{bool(robustness['mentions_sensitivity_analysis'])}`
+- Openness: open_data=`{bool(openness['has_open_data'])}`, \
+open_code=`{bool(openness['has_open_code'])}`, \
+preregistration=`{bool(openness['has_preregistration'])}`
+
+{_HDR_CITATIONS}
+- Has references section: `{has_ref_section}`
+- Estimated reference count: `{est_ref_count}`
+- DOI count: `{int(doi['count'])}` (examples: {doi['examples']})
+- URL count: `{int(urls['count'])}` (examples: {urls['examples']})
+- In-text citation count: `{int(in_text['count'])}` (examples: {in_text['examples']})
+- Bracket citation count: `{int(bracket['count'])}` (examples: {bracket['examples']})
+- Overall citation quality score: `{cit_score:.3f}`
+
+{_HDR_PLAGIARISM}
+- Overall suspicion score: `{plag_score:.3f}` {_LEG_PLAGIARISM}
+- N-gram repetition ratio (5-grams): `{ngram_rep:.4f}`
+- Repeated sentence ratio: `{sent_rep:.4f}`
+- Top repeated 5-grams: {plag['top_repeated_ngrams']}
+- Top repeated sentences: {plag['top_repeated_sentences']}
+
+{_HDR_FRAUD}
+- Overall fraud / anomaly suspicion score: `{fraud_score:.3f}` {_LEG_FRAUD}
+- Impossible or extreme p-values: `{int(impossible_p['count'])}` (examples: {impossible_p['examples']})
+- p-values clustered just below 0.05: `{int(cluster['count'])}` \
+(cluster ratio: `{float(cluster['cluster_ratio']):.4f}`) (examples: {cluster['examples']})
+- Extreme effect language occurrences: `{int(extreme_lang['count'])}` (examples: {extreme_lang['examples']})
+- Suspected mismatched p-text sentences: `{int(mismatch['count'])}` (examples: {mismatch['examples']})
+
+{_HDR_ETHICS}
+- Overall ethics / safety risk score: `{ethics_score:.3f}` {_LEG_ETHICS}
+- Overall ethics / safety risk score: `{ethics_score:.3f}` {_LEG_ETHICS}
+- Has human subjects: `{has_human_subjects}`
+- Has vulnerable population: `{has_vulnerable}`
+- Mentions ethics approval / IRB: `{has_ethics_approval}`
+- Mentions informed consent: `{has_consent}`
+- Mentions data protection / privacy: `{has_data_protection}`
+- High-risk / dual-use terms: `{int(risk_terms['count'])}` (examples: {risk_terms['examples']})
+
+{_HDR_INTEGRITY}
+- Is empty: `{bool(integrity['is_empty'])}`
+- Word count: `{word_count}`
+- Passes minimum word length threshold: `{passes_min_len}`
 
-        # Reasoning trace – first few steps
-        _add("## Reasoning Trace (first steps)\n")
-        for step in trace[:10]:
-            ts = step["timestamp"]
-            tag = step["tag"]
-            desc = step["description"]
-            _add(f"- **[{tag}]** `{ts}` – {desc}")
-            if step.get("metadata") is not None:
-                _add(f" - metadata: `{step['metadata']}`")
-        _add("")
+{_HDR_HALLUCINATION}
+- **Overall hallucination risk score**: `{risk:.4f}` (lower = more trustworthy)
+- **Passed all self-audits**: `{passed}`
+- **Total potential issues flagged**: `{hallucination_overall.get('total_findings', 0)}`
 
-        return "\n".join(lines)
+{findings_block}
+{_HDR_TRACE}{trace_block}
+"""
 
     def save_markdown(self, paper_name: str, result: dict[str, Any]) -> Path:
         md = self.generate_markdown(paper_name, result)
         safe_name = paper_name.replace(" ", "_")
         out_path = self.output_dir / f"{safe_name}_review.md"
-        out_path.write_text(md, encoding="utf-8")
+        # Encode up front and write bytes: no text-layer newline translation.
+        out_path.write_bytes(md.encode("utf-8"))
         return out_path
\ No newline at end of file
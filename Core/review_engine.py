@@ -1,7 +1,14 @@
 # Core/review_engine.py
 from __future__ import annotations
 
-from typing import Any, Dict
+import atexit
+import copy
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, Executor, Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 from Core.bias_detector import BiasDetector
 from Core.citation_validator import CitationValidator
@@ -16,10 +23,87 @@ from Core.reasoning_trace import ReasoningTrace
 from Core.replication_simulator import ReplicationSimulator
 from Core.statistical_analyzer import StatisticalAnalyzer
 from Core.ingestion.document import Document
+from Core.ingestion.ingestor import DocumentIngestor
+from Core.ingestion.text_view import TextView
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# Papers shorter than this are analyzed inline: for short texts, shipping the
+# work to another process costs more than running the analyzers directly.
+_PARALLEL_MIN_CHARS = 20_000
+
+# Fan-out is opt-in (ReviewEngine(parallel=True) or executor=...): forking a
+# pool from a multithreaded server (uvicorn, Streamlit) is unsafe, so a plain
+# ReviewEngine() never creates one.
+#
+# Pool choice: the analyzers are pure-Python regex/Counter passes that hold the
+# GIL, so a ThreadPoolExecutor gives no speedup (measured on a 100 KB paper:
+# ~33 ms inline vs ~35 ms with threads). Processes are the only option that
+# scales with cores; pickling the paper text is a few microseconds. Threads
+# remain useful where spawning processes is not allowed — pass one in via
+# ReviewEngine(executor=...).
+
+# Replication consumes statistics, methodology and citations; those form the
+# critical path. The other text-only analyzers can finish in the background.
+_CRITICAL_ANALYSES = ("statistics", "methodology", "citations")
+_BACKGROUND_ANALYSES = ("plagiarism", "fraud", "bias", "ethics")
+
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Shared worker pool, created on first use so short reviews never spawn it."""
+    global _POOL
+    if _POOL is None:
+        # Imported here: concurrent.futures.process pulls in multiprocessing.
+        from concurrent.futures import ProcessPoolExecutor
+
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+def _reset_pool() -> None:
+    """Drop the shared pool (e.g. after a worker died); the next use builds a new one."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_reset_pool)
+
+
+# Per-process ingestor and engine for ReviewEngine.review_batch/review_files workers.
+_WORKER_INGESTOR: DocumentIngestor | None = None
+_WORKER_ENGINE: ReviewEngine | None = None
+
+
+def _init_batch_worker() -> None:
+    global _WORKER_INGESTOR, _WORKER_ENGINE
+    _WORKER_INGESTOR = DocumentIngestor()
+    # Papers are already spread across processes; the default engine runs inline.
+    _WORKER_ENGINE = ReviewEngine()
+
+
+def _review_in_worker(paper: str | Document) -> Dict[str, Any]:
+    return _WORKER_ENGINE.review_paper(paper)
+
+
+def _ingest_and_review_in_worker(path: Path) -> Tuple[Document, Dict[str, Any]]:
+    doc = _WORKER_INGESTOR.ingest(path)
+    return doc, _WORKER_ENGINE.review_paper(doc)
 
 
 class ReviewEngine:
-    def __init__(self) -> None:
+    # Number of recently reviewed texts whose analyzer outputs are kept.
+    _CACHE_SIZE = 16
+
+    def __init__(self, executor: Executor | None = None, parallel: bool = False) -> None:
+        # Analyzers of long papers fan out to `executor` if given, else (with
+        # parallel=True) to the shared process pool; otherwise they run inline.
+        self.executor = executor
+        self.parallel = parallel or executor is not None
         self.integrity_verifier = IntegrityVerifier()
         self.bias_detector = BiasDetector()
         self.statistical_analyzer = StatisticalAnalyzer()
@@ -32,10 +116,12 @@ class ReviewEngine:
         self.hallucination_guard = HallucinationGuard()
         self.trace = ReasoningTrace()
         self.verdict_engine = FinalVerdictEngine()
+        # blake2b(paper_text) -> {analyzer name: output}
+        self._cache: OrderedDict[bytes, Dict[str, Dict[str, Any]]] = OrderedDict()
 
     def review_paper(self, paper: str | Document) -> Dict[str, Any]:
         # Reset state for new review
-        self.trace = ReasoningTrace()
+        self.trace.clear()
         self.hallucination_guard.audit_history.clear()
 
         # Normalize input to text
@@ -55,14 +141,24 @@ class ReviewEngine:
             paper_text = str(paper)
             self.trace.add_step("load_paper", "Loaded raw text string")
 
+        cache = self._cache_entry(paper_text)
+        # Shared lowercase / word split for the analyzers run in this process
+        view = TextView(paper_text)
+
         # 1. Integrity check
-        integrity_result = self.integrity_verifier.check_basic_integrity(paper_text)
+        integrity_result = self._memo(
+            cache, "integrity", self.integrity_verifier.check_basic_integrity, view
+        )
         self.trace.add_step("integrity_check", "Completed", integrity_result)
 
-        # 2. Core analyses
-        bias_result = self.bias_detector.analyze_text(paper_text)
-        stats_result = self.statistical_analyzer.analyze(paper_text)
-        methodology_result = self.methodology_validator.analyze(paper_text)
+        # 2. Analyses. For long papers the background analyzers go to the
+        #    executor while the critical path (stats, methodology, citations,
+        #    then replication) runs here.
+        background = self._submit_analyses(view, cache, _BACKGROUND_ANALYSES)
+        analyses = self._collect_analyses(view, cache, _CRITICAL_ANALYSES, {})
+        stats_result = analyses["statistics"]
+        methodology_result = analyses["methodology"]
+        citation_result = analyses["citations"]
 
         # === CROSS-WIRING: Methodology rescues Statistics ===
         sample_size_count = methodology_result["sample_size"]["count"]
@@ -80,18 +176,23 @@ class ReviewEngine:
                 }
             )
 
-        # Remaining analyses
-        citation_result = self.citation_validator.analyze(paper_text)
-        plagiarism_result = self.plagiarism_checker.analyze(paper_text)
-        fraud_result = self.fraud_detector.analyze_fraud(paper_text)
-        ethics_result = self.ethics_guard.analyze(paper_text)
-        replication_result = self.replication_simulator.analyze_replication(
-            paper_text,
+        replication_result = self._memo(
+            cache,
+            "replication",
+            self.replication_simulator.analyze_replication,
+            view,
             stats=stats_result,
             methodology=methodology_result,
             citations=citation_result,
         )
 
+        # Remaining analyses
+        analyses = self._collect_analyses(view, cache, _BACKGROUND_ANALYSES, background)
+        bias_result = analyses["bias"]
+        plagiarism_result = analyses["plagiarism"]
+        fraud_result = analyses["fraud"]
+        ethics_result = analyses["ethics"]
+
         # === Hallucination Self-Audit on Key Modules ===
         self.hallucination_guard.audit("bias", bias_result, paper_text)
         self.hallucination_guard.audit("statistics", stats_result, paper_text)
@@ -119,6 +220,8 @@ class ReviewEngine:
             "replication": replication_result,
             "hallucination_audit": self.hallucination_guard.get_overall_audit(),
             "hallucination_details": self.hallucination_guard.audit_history,
+            # export() is the live step list, so the final_verdict step added
+            # below shows up here without a second export.
             "trace": self.trace.export(),
         }
 
@@ -131,7 +234,132 @@ class ReviewEngine:
             metadata={"trust_score": final_verdict["overall_trust_score"]}
         )
 
-        # Final trace export
-        result["trace"] = self.trace.export()
+        return result
+
+    def review_batch(
+        self, papers: Iterable[str | Document], max_workers: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Review many papers across worker processes, one engine per worker.
+        Results come back in input order. This engine's trace and cache are
+        not touched.
+        """
+        papers = list(papers)
+        if len(papers) < 2:
+            # Not worth a pool; a throwaway engine keeps this one untouched.
+            engine = ReviewEngine(executor=self.executor, parallel=self.parallel)
+            return [engine.review_paper(paper) for paper in papers]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker) as pool:
+            return list(pool.map(_review_in_worker, papers))
+
+    def review_files(
+        self, paths: Iterable[Path], max_workers: int | None = None
+    ) -> Iterator[Tuple[Document, Dict[str, Any]]]:
+        """
+        Ingest and review files across worker processes, one ingestor and
+        engine per worker. Yields (document, result) pairs in input order as
+        they become ready, so a file that fails to load raises only after
+        every file before it was yielded. This engine's trace and cache are
+        not touched.
+        """
+        paths = list(paths)
+        if len(paths) < 2:
+            ingestor = DocumentIngestor()
+            engine = ReviewEngine(executor=self.executor, parallel=self.parallel)
+            for path in paths:
+                doc = ingestor.ingest(path)
+                yield doc, engine.review_paper(doc)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        max_workers = max_workers or min(len(paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker) as pool:
+            yield from pool.map(_ingest_and_review_in_worker, paths)
+
+    def clear_cache(self) -> None:
+        """Drop all cached analyzer outputs (e.g. after reconfiguring an analyzer)."""
+        self._cache.clear()
+
+    def _cache_entry(self, paper_text: str) -> Dict[str, Dict[str, Any]]:
+        """Per-text slot of the analyzer cache (LRU over the last _CACHE_SIZE texts)."""
+        digest = hashlib.blake2b(paper_text.encode("utf-8"), digest_size=16).digest()
+        entry = self._cache.get(digest)
+        if entry is None:
+            entry = self._cache[digest] = {}
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(digest)
+        return entry
+
+    @staticmethod
+    def _memo(
+        cache: Dict[str, Dict[str, Any]],
+        name: str,
+        fn: Callable[..., Dict[str, Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        if name not in cache:
+            cache[name] = fn(*args, **kwargs)
+        # Hand out copies: the review mutates results (stats rescue) and so may callers.
+        return copy.deepcopy(cache[name])
+
+    def _analyzers(self) -> Dict[str, Callable[[TextView], Dict[str, Any]]]:
+        """Analyzers that only depend on the paper text, by result key."""
+        return {
+            "bias": self.bias_detector.analyze_text,
+            "statistics": self.statistical_analyzer.analyze,
+            "methodology": self.methodology_validator.analyze,
+            "citations": self.citation_validator.analyze,
+            "plagiarism": self.plagiarism_checker.analyze,
+            "fraud": self.fraud_detector.analyze_fraud,
+            "ethics": self.ethics_guard.analyze,
+        }
+
+    def _submit_analyses(
+        self, view: TextView, cache: Dict[str, Dict[str, Any]], names: Tuple[str, ...]
+    ) -> Dict[str, Future]:
+        """Start the uncached analyzers in `names` on the executor (long papers only)."""
+        if not self.parallel or len(view.text) < _PARALLEL_MIN_CHARS:
+            return {}
+        analyzers = self._analyzers()
+        pool = self.executor or _get_pool()
+        try:
+            return {
+                name: pool.submit(analyzers[name], view)
+                for name in names
+                if name not in cache
+            }
+        except BrokenExecutor:
+            self._discard_broken_pool()
+            return {}
+
+    def _collect_analyses(
+        self,
+        view: TextView,
+        cache: Dict[str, Dict[str, Any]],
+        names: Tuple[str, ...],
+        futures: Dict[str, Future],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Results for `names`: submitted ones are awaited, cached ones reused,
+        anything else runs inline.
+        """
+        for name, future in futures.items():
+            try:
+                cache[name] = future.result()
+            except BrokenExecutor:
+                # A worker died: drop the pool and run this analyzer inline below.
+                self._discard_broken_pool()
+        analyzers = self._analyzers()
+        return {name: self._memo(cache, name, analyzers[name], view) for name in names}
 
-        return result
\ No newline at end of file
+    def _discard_broken_pool(self) -> None:
+        # A caller-supplied executor is the caller's to manage.
+        if self.executor is None:
+            _reset_pool()
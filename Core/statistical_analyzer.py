@@ -3,6 +3,8 @@
 import re
 from typing import Dict, Any
 
+from Core.ingestion.text_view import TextView
+
 
 class StatisticalAnalyzer:
     """
@@ -19,20 +21,21 @@ class StatisticalAnalyzer:
     P_VALUE_PATTERN = re.compile(r"\bp\s*[<=>]\s*0\.\d+", re.IGNORECASE)
     CI_PATTERN = re.compile(r"\b\d+%\s*CI\b|\bCI\s*\[", re.IGNORECASE)
 
-    TEST_TERMS = [
+    # Tuples, not frozensets: reported terms keep this order.
+    TEST_TERMS = (
         "t-test", "t test", "anova", "regression", "chi-square", "chi square",
         "manova", "wilcoxon", "kruskal-wallis", "pearson correlation",
         "spearman correlation", "mixed model", "linear model"
-    ]
+    )
 
-    EFFECT_AND_POWER_TERMS = [
+    EFFECT_AND_POWER_TERMS = (
         "effect size", "cohen's d", "eta-squared", "eta squared",
         "standardized effect", "power analysis", "statistical power",
         "hedges g", "omega-squared"
-    ]
+    )
 
-    def analyze(self, text: str) -> Dict[str, Any]:
-        text_lower = text.lower()
+    def analyze(self, text: str | TextView) -> Dict[str, Any]:
+        text_lower = TextView.of(text).lower
 
         # --- P-values ---
         p_values = self.P_VALUE_PATTERN.findall(text_lower)
@@ -44,11 +47,11 @@ class StatisticalAnalyzer:
 
         # --- Tests ---
         tests_present = [t for t in self.TEST_TERMS if t in text_lower]
-        has_tests = len(tests_present) > 0
+        has_tests = bool(tests_present)
 
         # --- Effect sizes + power ---
         effect_terms_present = [t for t in self.EFFECT_AND_POWER_TERMS if t in text_lower]
-        has_effect_terms = len(effect_terms_present) > 0
+        has_effect_terms = bool(effect_terms_present)
 
         # ---------------------------------------------------------------------
         # 🔥 UPDATED LOGIC:
@@ -1,5 +1,5 @@
 # Evaluation/decision_matrix.py
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, List, Tuple
 from Evaluation.scoring.bias_score import BiasScorer
 from Evaluation.scoring.replicability_score import ReplicabilityScorer
 from Evaluation.scoring.methodology_score import MethodologyScorer
@@ -23,28 +23,40 @@ class DecisionMatrix:
     }
 
     @staticmethod
-    def compute_trust(result: Dict[str, Any]) -> Dict[str, Any]:
-        stats = StatisticalRigorScorer.score(result["statistics"])
-        meth = MethodologyScorer.score(result["methodology"])
-        repl = ReplicabilityScorer.score(result["replication"])
-        cit = result["citations"].get("overall_citation_quality_score", 0.0)
-        bias = 1.0 - BiasScorer.score(result["bias"])
-        plag = 1.0 - result["plagiarism"].get("overall_plagiarism_suspicion_score", 0.0)
-        fraud = 1.0 - result["fraud"].get("overall_fraud_suspicion_score", 0.0)
-        ethics = EthicalIntegrityScorer.score(result["ethics"])
-
-        trust = (
-            DecisionMatrix.WEIGHTS["statistics"] * stats +
-            DecisionMatrix.WEIGHTS["methodology"] * meth +
-            DecisionMatrix.WEIGHTS["replicability"] * repl +
-            DecisionMatrix.WEIGHTS["citations"] * cit +
-            DecisionMatrix.WEIGHTS["bias"] * bias +
-            DecisionMatrix.WEIGHTS["plagiarism"] * plag +
-            DecisionMatrix.WEIGHTS["fraud"] * fraud +
-            DecisionMatrix.WEIGHTS["ethics"] * ethics
+    def _components(result: Dict[str, Any]) -> Tuple[float, ...]:
+        """Component scores in _WEIGHT_VECTOR order (inverted ones already flipped)."""
+        return (
+            StatisticalRigorScorer.score(result["statistics"]),
+            MethodologyScorer.score(result["methodology"]),
+            ReplicabilityScorer.score(result["replication"]),
+            result["citations"].get("overall_citation_quality_score", 0.0),
+            1.0 - BiasScorer.score(result["bias"]),
+            1.0 - result["plagiarism"].get("overall_plagiarism_suspicion_score", 0.0),
+            1.0 - result["fraud"].get("overall_fraud_suspicion_score", 0.0),
+            EthicalIntegrityScorer.score(result["ethics"]),
         )
 
-        trust = max(0.0, min(1.0, trust))
+    @staticmethod
+    def _weighted_trust(components: Tuple[float, ...]) -> float:
+        trust = sum(w * v for w, v in zip(_WEIGHT_VECTOR, components))
+        return max(0.0, min(1.0, trust))
+
+    @staticmethod
+    def compute_trust_batch(results: Iterable[Dict[str, Any]]) -> List[float]:
+        """
+        Trust scores only (unrounded, clamped to [0, 1]) for many reviews,
+        e.g. for leaderboards or CSV/JSON exports.
+        """
+        return [
+            DecisionMatrix._weighted_trust(DecisionMatrix._components(result))
+            for result in results
+        ]
+
+    @staticmethod
+    def compute_trust(result: Dict[str, Any]) -> Dict[str, Any]:
+        components = DecisionMatrix._components(result)
+        stats, meth, repl, cit, bias, plag, fraud, ethics = components
+        trust = DecisionMatrix._weighted_trust(components)
 
         label = "Reliable" if trust >= 0.70 else "Mixed" if trust >= 0.40 else "High Risk"
 
@@ -61,4 +73,12 @@ class DecisionMatrix:
                 "fraud_good": round(fraud, 4),
                 "ethics_good": round(ethics, 4),
             }
-        }
\ No newline at end of file
+        }
+
+
+# WEIGHTS in compute_trust's component order, built once at import.
+_WEIGHT_VECTOR = tuple(
+    DecisionMatrix.WEIGHTS[k]
+    for k in ("statistics", "methodology", "replicability", "citations",
+              "bias", "plagiarism", "fraud", "ethics")
+)
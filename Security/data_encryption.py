@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from cryptography.fernet import Fernet
-from typing import Optional
+from typing import Iterable, List, Optional
 
 class DataEncryptor:
     """
@@ -19,5 +19,14 @@ class DataEncryptor:
     def decrypt(self, token: bytes) -> str:
         return self.cipher.decrypt(token).decode("utf-8")
 
+    def encrypt_many(self, items: Iterable[str]) -> List[bytes]:
+        """Encrypt several records with the one cipher (key is derived once per instance)."""
+        encrypt = self.cipher.encrypt
+        return [encrypt(item.encode("utf-8")) for item in items]
+
+    def decrypt_many(self, tokens: Iterable[bytes]) -> List[str]:
+        decrypt = self.cipher.decrypt
+        return [decrypt(token).decode("utf-8") for token in tokens]
+
     def get_key(self) -> bytes:
         return self.key
\ No newline at end of file
@@ -11,11 +11,10 @@ class ProvenanceTracker:
     """
     @staticmethod
     def hash_file(path: Path) -> str:
-        sha256 = hashlib.sha256()
+        # SHA-256 is kept so recorded provenance hashes stay comparable;
+        # file_digest reads into its own large buffer without Python-level chunking.
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     @staticmethod
     def track_input(file_path: Path, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,10 +1,16 @@
 # Security/sandbox_executor.py
 from __future__ import annotations
 
+import hashlib
 import subprocess
+import sys
 import tempfile
 import os
-from typing import Dict, Any
+import signal
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import IO, Any, Deque, Dict, List
 from pathlib import Path
 
 class SandboxExecutor:
@@ -12,41 +18,144 @@ class SandboxExecutor:
     Secure sandbox for executing untrusted code snippets (e.g., from papers claiming reproducibility).
     Uses restricted environment and timeout.
     """
+    # Number of recently run snippets whose results are kept.
+    _CACHE_SIZE = 256
+    # Per stream; longer output keeps only its tail, behind the marker.
+    _MAX_OUTPUT_CHARS = 256 * 1024
+    _TRUNCATION_MARKER = "...[truncated]\n"
+    # How long a killed run's pipe readers get to hit EOF before we give up.
+    _READER_GRACE_SECONDS = 1.0
+
     def __init__(self, timeout_seconds: int = 30):
         self.timeout = timeout_seconds
+        # blake2b(code) -> result of a run that exited on its own
+        self._cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
 
-    def execute_code(self, code: str, language: str = "python") -> Dict[str, Any]:
+    def execute_code(self, code: str, language: str = "python", cache: bool = True) -> Dict[str, Any]:
+        """
+        Run a snippet in a fresh interpreter. Results of snippets that ran to
+        completion are cached by content; pass cache=False to force a new run
+        (e.g. to check that a snippet's output is reproducible).
+        """
         if language != "python":
             return {"error": "Only Python execution supported", "output": "", "success": False}
 
+        key = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+        if cache and key in self._cache:
+            self._cache.move_to_end(key)
+            return dict(self._cache[key])
+
+        result = self._run(code)
+        # Timeouts and launch errors may be transient; only completed runs are kept.
+        if "return_code" in result:
+            self._cache[key] = dict(result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def _run(self, code: str) -> Dict[str, Any]:
         with tempfile.TemporaryDirectory() as tmpdir:
             code_path = Path(tmpdir) / "script.py"
             code_path.write_text(code, encoding="utf-8")
 
             try:
-                result = subprocess.run(
-                    ["python", str(code_path)],
-                    capture_output=True,
+                # -I: isolated mode (no user site, PYTHON* env vars ignored),
+                # -S: no site import, -B: no .pyc writes. Resolved via
+                # sys.executable because the restricted PATH can't find "python".
+                # Own session -> own process group (POSIX), so a timeout can
+                # kill anything the snippet spawned, not just the interpreter.
+                proc = subprocess.Popen(
+                    [sys.executable, "-I", "-S", "-B", str(code_path)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=self.timeout,
+                    errors="replace",  # arbitrary bytes from the snippet mustn't kill a reader
                     cwd=tmpdir,
-                    env={"PATH": ""}  # Restricted environment
+                    env={"PATH": ""},  # Restricted environment
+                    start_new_session=os.name == "posix",
                 )
+                # Drain both pipes concurrently, keeping only a bounded tail
+                # of each, so a runaway print loop can't exhaust our memory.
+                stdout: List[str] = []
+                stderr: List[str] = []
+                readers = [
+                    threading.Thread(target=self._read_tail, args=(proc.stdout, stdout), daemon=True),
+                    threading.Thread(target=self._read_tail, args=(proc.stderr, stderr), daemon=True),
+                ]
+                for reader in readers:
+                    reader.start()
+
+                # The deadline also covers children that outlive the
+                # interpreter while holding its pipes open.
+                deadline = time.monotonic() + self.timeout
+                try:
+                    proc.wait(timeout=self.timeout)
+                    for reader in readers:
+                        reader.join(max(0.0, deadline - time.monotonic()))
+                    timed_out = any(reader.is_alive() for reader in readers)
+                except subprocess.TimeoutExpired:
+                    timed_out = True
+                if timed_out:
+                    self._kill_group(proc)
+                    # A grandchild that left the group (setsid) can keep a pipe
+                    # open forever. Don't wait on it: the reader threads are
+                    # daemons and close their pipe themselves at EOF (closing it
+                    # here would block on the reader's buffer lock).
+                    grace_deadline = time.monotonic() + self._READER_GRACE_SECONDS
+                    for reader in readers:
+                        reader.join(max(0.0, grace_deadline - time.monotonic()))
+                    return {
+                        "success": False,
+                        "error": f"Execution timed out after {self.timeout} seconds",
+                        "output": "",
+                    }
                 return {
-                    "success": result.returncode == 0,
-                    "output": result.stdout,
-                    "error": result.stderr,
-                    "return_code": result.returncode,
-                }
-            except subprocess.TimeoutExpired:
-                return {
-                    "success": False,
-                    "error": f"Execution timed out after {self.timeout} seconds",
-                    "output": "",
+                    "success": proc.returncode == 0,
+                    # Each list holds the reader's one result ("" if it never finished).
+                    "output": "".join(stdout),
+                    "error": "".join(stderr),
+                    "return_code": proc.returncode,
                 }
             except Exception as e:
                 return {
                     "success": False,
                     "error": str(e),
                     "output": "",
-                }
\ No newline at end of file
+                }
+
+    @classmethod
+    def _read_tail(cls, pipe: IO[str], out: List[str]) -> None:
+        """Read `pipe` to EOF and append its last _MAX_OUTPUT_CHARS characters to `out`."""
+        chunks: Deque[str] = deque()
+        size = 0
+        truncated = False
+        try:
+            for chunk in iter(lambda: pipe.read(8192), ""):
+                chunks.append(chunk)
+                size += len(chunk)
+                # Drop whole chunks while the rest still covers the limit.
+                while size - len(chunks[0]) >= cls._MAX_OUTPUT_CHARS:
+                    size -= len(chunks.popleft())
+                    truncated = True
+        except (OSError, ValueError):
+            pass  # broken pipe or undecodable output: keep what was read
+        finally:
+            pipe.close()
+        text = "".join(chunks)
+        if len(text) > cls._MAX_OUTPUT_CHARS:
+            text = text[-cls._MAX_OUTPUT_CHARS:]
+            truncated = True
+        out.append(cls._TRUNCATION_MARKER + text if truncated else text)
+
+    @staticmethod
+    def _kill_group(proc: subprocess.Popen) -> None:
+        if os.name == "posix":
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # group already gone
+        else:
+            proc.kill()
+        # Reap the child; the pipes close once every group member is dead.
+        proc.wait()
@@ -2,16 +2,43 @@
 """
 Secure audit logging configuration
 """
+from __future__ import annotations
+
 import logging
+import time
 from pathlib import Path
 
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    filename=LOG_DIR / "audit.log",
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-)
 
-audit_logger = logging.getLogger("nobias_audit")
\ No newline at end of file
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that renders the date/time part of asctime once per wall-clock
+    second instead of calling localtime + strftime for every record.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._cached_sec = -1
+        self._cached_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_str = time.strftime(self.default_time_format, self.converter(sec))
+            self._cached_sec = sec
+        return self.default_msec_format % (self._cached_str, record.msecs)
+
+
+# Attached to the audit logger itself rather than via basicConfig, which is a
+# no-op once the host app (uvicorn, Streamlit) has configured the root logger.
+# delay=True: the file is opened on the first record, not at import.
+_file_handler = logging.FileHandler(LOG_DIR / "audit.log", delay=True)
+_file_handler.setFormatter(_SecondCachedFormatter("%(asctime)s | %(levelname)s | %(message)s"))
+
+audit_logger = logging.getLogger("nobias_audit")
+audit_logger.setLevel(logging.INFO)
+audit_logger.addHandler(_file_handler)
+# Audit records go to audit.log only, not to the host app's console handlers.
+audit_logger.propagate = False
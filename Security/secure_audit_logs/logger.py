@@ -4,7 +4,8 @@ from __future__ import annotations
 from . import audit_logger
 
 def log_event(event: str, details: dict | None = None) -> None:
-    msg = event
+    # Lazy %-args: details is only repr'd if the record is actually emitted.
     if details:
-        msg += f" | details: {details}"
-    audit_logger.info(msg)
\ No newline at end of file
+        audit_logger.info("%s | details: %s", event, details)
+    else:
+        audit_logger.info("%s", event)
\ No newline at end of file
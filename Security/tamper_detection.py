@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 from pathlib import Path
+from typing import Any, Dict, Tuple
 
 class TamperDetector:
     """
@@ -13,28 +16,70 @@ class TamperDetector:
         self.hash_store.parent.mkdir(parents=True, exist_ok=True)
         if not self.hash_store.exists():
             self.hash_store.write_text("{}")
+        # Parsed store; re-read only when the file on disk changes.
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._data_stamp: Tuple[int, int, int] | None = None
+        # path -> (stat fingerprint, stored hash) of files that verified OK
+        self._verified: Dict[str, Tuple[Tuple[int, ...], str]] = {}
 
     def store_hash(self, file_path: Path, file_hash: str, metadata: str = "") -> None:
-        data = {}
-        if self.hash_store.read_text():
-            import json
-            data = json.loads(self.hash_store.read_text())
-        data[str(file_path)] = {"hash": file_hash, "metadata": metadata}
-        self.hash_store.write_text(json.dumps(data, indent=2))
-
-    def verify(self, file_path: Path) -> bool:
-        if not file_path.exists():
+        self.store_hashes({file_path: file_hash}, metadata)
+
+    def store_hashes(self, hashes: Dict[Path, str], metadata: str = "") -> None:
+        """Record several hashes with a single rewrite of the store."""
+        data = self._load()
+        for file_path, file_hash in hashes.items():
+            data[str(file_path)] = {"hash": file_hash, "metadata": metadata}
+        self._save()
+
+    def verify(self, file_path: Path, strict: bool = False) -> bool:
+        """
+        True if the file matches its stored hash. Files that already verified
+        and whose stat fingerprint is unchanged are not rehashed unless strict.
+        """
+        try:
+            fingerprint = self._fingerprint(file_path)
+        except FileNotFoundError:
             return False
-        current_hash = self._hash_file(file_path)
-        import json
-        stored = json.loads(self.hash_store.read_text() or "{}")
-        stored_entry = stored.get(str(file_path), {})
-        return stored_entry.get("hash") == current_hash
+        key = str(file_path)
+        stored_hash = self._load().get(key, {}).get("hash")
+        if not strict and self._verified.get(key) == (fingerprint, stored_hash):
+            return True
+
+        # Fingerprint taken before hashing: a write during the hash changes ctime.
+        ok = stored_hash == self._hash_file(file_path)
+        if ok:
+            self._verified[key] = (fingerprint, stored_hash)
+        else:
+            self._verified.pop(key, None)
+        return ok
+
+    @staticmethod
+    def _fingerprint(file_path: Path) -> Tuple[int, ...]:
+        # ctime can't be set from user space (utime updates it), so restoring
+        # mtime after an in-place edit still changes the fingerprint.
+        st = file_path.stat()
+        return (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        st = self.hash_store.stat()
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if stamp != self._data_stamp:
+            self._data = json.loads(self.hash_store.read_text() or "{}")
+            self._data_stamp = stamp
+        return self._data
+
+    def _save(self) -> None:
+        # Write a sibling file and swap it in, so readers never see a partial store.
+        tmp = self.hash_store.with_name(self.hash_store.name + ".tmp")
+        tmp.write_text(json.dumps(self._data, separators=(",", ":")))
+        os.replace(tmp, self.hash_store)
+        st = self.hash_store.stat()
+        self._data_stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
 
     @staticmethod
     def _hash_file(path: Path) -> str:
-        sha256 = hashlib.sha256()
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
\ No newline at end of file
+            # file_digest reads 256 KiB chunks into one reused buffer; unlike
+            # mmap it can't SIGBUS if the file is truncated mid-hash.
+            return hashlib.file_digest(f, "sha256").hexdigest()
@@ -0,0 +1,16 @@
+# Tests/test_decision_matrix.py
+from Core.review_engine import ReviewEngine
+from Evaluation.decision_matrix import DecisionMatrix
+
+def test_decision_matrix_batch_matches_single():
+    engine = ReviewEngine()
+    results = [
+        engine.review_paper("We conducted a randomized experiment with n = 120 participants (p = 0.032)."),
+        engine.review_paper("This groundbreaking study clearly proves our theory."),
+    ]
+    scores = DecisionMatrix.compute_trust_batch(results)
+
+    assert len(scores) == 2
+    for score, result in zip(scores, results):
+        assert 0.0 <= score <= 1.0
+        assert round(score, 4) == DecisionMatrix.compute_trust(result)["overall_trust_score"]
\ No newline at end of file
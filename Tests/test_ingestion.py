@@ -0,0 +1,36 @@
+# Tests/test_ingestion.py
+from Core.ingestion import DocumentIngestor
+
+def test_ingest_bytes_matches_ingest(tmp_path):
+    """
+    In-memory uploads ingest to the same Document as the file on disk.
+    """
+    data = b"Abstract\nWe report p = 0.03 with n = 40 participants.\n\nMethods\nA survey.\n"
+    path = tmp_path / "paper.txt"
+    path.write_bytes(data)
+    ingestor = DocumentIngestor()
+
+    from_disk = ingestor.ingest(path)
+    from_memory = ingestor.ingest_bytes(data, "paper.txt")
+
+    assert from_memory.clean_text == from_disk.clean_text
+    assert from_memory.sections == from_disk.sections
+    assert from_memory.byte_size == from_disk.byte_size
+    assert from_memory.doc_type == "txt"
+
+def test_ingestor_caches_documents(tmp_path):
+    """
+    Re-ingesting unchanged content returns the cached Document; a modified
+    file is ingested again.
+    """
+    ingestor = DocumentIngestor()
+    data = b"We report p = 0.03 with n = 40 participants."
+    assert ingestor.ingest_bytes(data, "a.txt") is ingestor.ingest_bytes(data, "a.txt")
+
+    path = tmp_path / "paper.txt"
+    path.write_bytes(data)
+    first = ingestor.ingest(path)
+    assert ingestor.ingest(path) is first
+
+    path.write_bytes(data + b" Revised.")  # new size -> new cache key
+    assert ingestor.ingest(path).clean_text.endswith("Revised.")
\ No newline at end of file
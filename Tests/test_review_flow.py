@@ -192,4 +192,184 @@ def test_report_generator_creates_markdown(tmp_path):
     assert "## Ethics & Safety" in content
     assert "## Integrity Checks" in content
     assert "## Self-Audit: Hallucination & Overconfidence Check" in content
-    assert "## Reasoning Trace (first steps)" in content
\ No newline at end of file
+    assert "## Reasoning Trace (first steps)" in content
+
+def test_report_cache_keeps_distinct_metadata_apart(tmp_path):
+    """
+    Results that render differently never share a cached report.
+    """
+    generator = ReportGenerator(output_dir=tmp_path)
+    result = ReviewEngine().review_paper("We had n = 120 participants (p = 0.032).")
+
+    rendered = []
+    for metadata in ({1: "x"}, {"1": "x"}, {"k": (1, 2)}, {"k": [1, 2]}):
+        result["trace"][0]["metadata"] = metadata
+        rendered.append(generator.generate_markdown("paper", result))
+        assert f"`{metadata!r}`" in rendered[-1]
+
+    assert len(set(rendered)) == 4
+    assert generator.generate_markdown("paper", result) == rendered[-1]
+
+def test_parallel_review_matches_inline():
+    """
+    Long papers are fanned out to an executor; results must match the
+    inline path exactly.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paragraph = (
+        "We conducted a randomized experiment with n = 120 participants. "
+        "The effect was significant (p = 0.032) with a 95% CI [0.1, 0.4]. "
+        "This groundbreaking work is clearly remarkable (Smith et al., 2020) [3]. "
+    )
+    long_text = paragraph * 120  # well above the inline threshold
+    short_engine = ReviewEngine()
+    inline = {
+        "bias": short_engine.bias_detector.analyze_text(long_text),
+        "statistics": short_engine.statistical_analyzer.analyze(long_text),
+        "plagiarism": short_engine.plagiarism_checker.analyze(long_text),
+        "fraud": short_engine.fraud_detector.analyze_fraud(long_text),
+    }
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = ReviewEngine(executor=executor).review_paper(long_text)
+
+    for key, expected in inline.items():
+        assert result[key] == expected
+
+def test_broken_shared_pool_falls_back_inline(monkeypatch):
+    """
+    A dead worker pool is discarded and the review still completes inline.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+    import Core.review_engine as review_engine
+
+    class _BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, *args, **kwargs):
+            pass
+
+    long_text = "The effect was significant (p = 0.032) with n = 120. " * 600
+    expected = ReviewEngine().review_paper(long_text)
+
+    monkeypatch.setattr(review_engine, "_POOL", _BrokenPool())
+    result = ReviewEngine(parallel=True).review_paper(long_text)
+
+    assert review_engine._POOL is None
+    assert result["statistics"] == expected["statistics"]
+    assert result["bias"] == expected["bias"]
+
+def test_repeat_review_uses_cache():
+    """
+    Re-reviewing the same text reuses cached analyzer outputs without
+    leaking mutations between runs.
+    """
+    text = (
+        "We conducted a randomized experiment with n = 120 participants. "
+        "The effect was significant (p = 0.032) with a 95% CI [0.1, 0.4]."
+    )
+    engine = ReviewEngine()
+    first = engine.review_paper(text)
+    first["statistics"]["overall_rigor_score"] = -1.0
+    second = engine.review_paper(text)
+
+    assert len(engine._cache) == 1
+    assert second["statistics"]["overall_rigor_score"] != -1.0
+    assert second["final_verdict"] == first["final_verdict"]
+
+    engine.clear_cache()
+    assert not engine._cache
+
+def test_trace_survives_next_review():
+    """
+    The engine reuses its ReasoningTrace; an earlier result's trace must
+    not be wiped by the next review.
+    """
+    engine = ReviewEngine()
+    first = engine.review_paper("We report p = 0.03 with n = 40 participants.")
+    steps = len(first["trace"])
+    engine.review_paper("A second, unrelated paper text.")
+
+    assert steps > 0
+    assert len(first["trace"]) == steps
+
+def test_analyzers_accept_text_view():
+    """
+    Analyzers give the same output for a plain string and a shared TextView,
+    and a TextView pickles down to its text (process-pool workers).
+    """
+    import pickle
+    from Core.ingestion.text_view import TextView
+
+    text = (
+        "We conducted a randomized experiment with n = 120 participants. "
+        "This groundbreaking result was significant (p = 0.032). References\n"
+        "Smith, J. (2020). A study. doi:10.1000/xyz123\n"
+    )
+    engine = ReviewEngine()
+    view = TextView(text)
+    assert view.lower and view.words
+    assert pickle.loads(pickle.dumps(view)).text == text
+
+    for analyze in (
+        engine.integrity_verifier.check_basic_integrity,
+        engine.bias_detector.analyze_text,
+        engine.statistical_analyzer.analyze,
+        engine.methodology_validator.analyze,
+        engine.citation_validator.analyze,
+        engine.plagiarism_checker.analyze,
+        engine.fraud_detector.analyze_fraud,
+        engine.ethics_guard.analyze,
+        engine.replication_simulator.analyze_replication,
+    ):
+        assert analyze(view) == analyze(text)
+
+def test_review_batch_matches_single_reviews():
+    """
+    Batch review runs in worker processes and returns results in input order.
+    """
+    papers = [
+        "We conducted a randomized experiment with n = 120 participants (p = 0.032).",
+        "This groundbreaking study clearly proves our theory.",
+        "n = 15 patients were enrolled; informed consent was obtained.",
+    ]
+    engine = ReviewEngine()
+    batch = engine.review_batch(papers)
+
+    assert len(batch) == len(papers)
+    for paper, result in zip(papers, batch):
+        single = ReviewEngine().review_paper(paper)
+        assert result["final_verdict"] == single["final_verdict"]
+        assert result["statistics"] == single["statistics"]
+
+def test_review_files_ingests_in_workers(tmp_path):
+    """
+    File review ingests and reviews in worker processes, in input order.
+    """
+    texts = [
+        "We conducted a randomized experiment with n = 120 participants (p = 0.032).",
+        "This groundbreaking study clearly proves our theory.",
+    ]
+    paths = []
+    for i, text in enumerate(texts):
+        path = tmp_path / f"paper_{i}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+
+    pairs = list(ReviewEngine().review_files(paths))
+
+    assert len(pairs) == len(paths)
+    for path, (doc, result) in zip(paths, pairs):
+        assert doc.source_path == path
+        single = ReviewEngine().review_paper(doc)
+        assert result["final_verdict"] == single["final_verdict"]
+
+def test_review_batch_single_paper_leaves_engine_untouched():
+    engine = ReviewEngine()
+    [result] = engine.review_batch(["This groundbreaking study clearly proves our theory."])
+
+    assert result["trace"]
+    assert engine.trace.export() == []
+    assert len(engine._cache) == 0
\ No newline at end of file
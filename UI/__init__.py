@@ -7,15 +7,10 @@ Contains the multi-page Streamlit application:
 - Submission portal
 - Search interface
 - Reviewer feedback viewer
-"""
 
-# Re-export pages for potential imports (optional but clean)
-from . import dashboard
-from .submission_portal import *
-from .search_interface import *
-from .reviewer_feedback_viewer import *
+The pages are Streamlit scripts, run by `streamlit run`, not imported:
+importing one executes it, including st.set_page_config() and the
+review engine setup. So nothing is imported here.
+"""
 
-__all__ = [
-    "dashboard",
-    # Pages are discovered automatically by Streamlit — no need to list functions
-]
\ No newline at end of file
+__all__: list[str] = []
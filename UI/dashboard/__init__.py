@@ -3,11 +3,8 @@
 Nobias AI Peer Review Dashboard submodule
 
 Contains the main dashboard page (app.py) and supporting assets/graphs.
+app.py is a Streamlit script (run_dashboard.py / `streamlit run`), so it is
+deliberately not imported here.
 """
 
-# Make the main app importable if needed
-from .app import *
-
-__all__ = [
-    "app",  # Exposes the main Streamlit page
-]
\ No newline at end of file
+__all__: list[str] = []
@@ -1,6 +1,7 @@
 # UI/dashboard/app.py
 from __future__ import annotations
 
+import orjson
 import streamlit as st
 from pathlib import Path
 
@@ -16,10 +17,24 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Initialize core
-engine = ReviewEngine()
-report_generator = ReportGenerator(output_dir="reports")
-ingestor = DocumentIngestor()
+# Initialize core once instead of on every rerun (each widget interaction).
+# One ingestor is deliberately shared by all sessions, so its bounded ingest
+# cache serves repeat uploads from any session; the engine and report
+# generator keep per-review state and caches, so each session gets its own.
+@st.cache_resource
+def get_ingestor() -> DocumentIngestor:
+    return DocumentIngestor()
+
+
+def get_session_core() -> tuple[ReviewEngine, ReportGenerator]:
+    if "engine" not in st.session_state:
+        st.session_state.engine = ReviewEngine()
+        st.session_state.report_generator = ReportGenerator(output_dir="reports")
+    return st.session_state.engine, st.session_state.report_generator
+
+
+engine, report_generator = get_session_core()
+ingestor = get_ingestor()
 
 # Directories
 REPORT_DIR = Path("reports")
@@ -49,18 +64,29 @@ with st.sidebar:
     """)
     st.info("Built by Youssef — December 2025")
 
+def clear_inputs() -> None:
+    """Clear button callback; runs before the rerun, so the widgets render empty."""
+    st.session_state.paper_text = ""
+    st.session_state.paper_name = ""
+    # An uploader's value can't be assigned; a new key gives a fresh, empty widget.
+    st.session_state.upload_key = st.session_state.get("upload_key", 0) + 1
+
+
 # Main upload area
 st.subheader("Submit a Paper")
-uploaded_file = st.file_uploader("Upload PDF or text file", type=["pdf", "txt", "md"])
-paper_text = st.text_area("Or paste raw text here", height=200)
-paper_name = st.text_input("Paper name (optional)", placeholder="e.g., My Breakthrough Study")
+uploaded_file = st.file_uploader(
+    "Upload PDF or text file",
+    type=["pdf", "txt", "md"],
+    key=f"upload_{st.session_state.get('upload_key', 0)}",
+)
+paper_text = st.text_area("Or paste raw text here", height=200, key="paper_text")
+paper_name = st.text_input(
+    "Paper name (optional)", placeholder="e.g., My Breakthrough Study", key="paper_name"
+)
 
 col1, col2 = st.columns([1, 3])
 submit = col1.button("Review Paper", type="primary", use_container_width=True)
-clear = col2.button("Clear", use_container_width=True)
-
-if clear:
-    st.experimental_rerun()
+col2.button("Clear", use_container_width=True, on_click=clear_inputs)
 
 if submit:
     if not uploaded_file and not paper_text.strip():
@@ -69,11 +95,8 @@ if submit:
         with st.spinner("Nobias is reviewing your paper... This may take 10–30 seconds."):
             try:
                 if uploaded_file:
-                    # Save temporarily
-                    temp_path = Path("uploads") / uploaded_file.name
-                    temp_path.parent.mkdir(exist_ok=True)
-                    temp_path.write_bytes(uploaded_file.getvalue())
-                    doc = ingestor.ingest(temp_path)
+                    # Ingested from memory; the upload is never written to disk
+                    doc = ingestor.ingest_bytes(uploaded_file.getvalue(), uploaded_file.name)
                     result = engine.review_paper(doc)
                 else:
                     result = engine.review_paper(paper_text)
@@ -99,16 +122,16 @@ if submit:
                 st.subheader("Full Review Report")
                 report_file = REPORT_DIR / report_path.name
                 if report_file.exists():
-                    report_md = report_file.read_text(encoding="utf-8")
-                    st.markdown(report_md)
-
-                    with open(report_file, "rb") as f:
-                        st.download_button(
-                            "Download Report (Markdown)",
-                            f,
-                            file_name=report_path.name,
-                            mime="text/markdown",
-                        )
+                    # One read serves both the rendered view and the download.
+                    report_bytes = report_file.read_bytes()
+                    st.markdown(report_bytes.decode("utf-8"))
+
+                    st.download_button(
+                        "Download Report (Markdown)",
+                        report_bytes,
+                        file_name=report_path.name,
+                        mime="text/markdown",
+                    )
                 else:
                     st.warning("Report generated but not found. Please refresh.")
 
@@ -124,7 +147,7 @@ if submit:
                             line += f" (Confidence: {conf})"
                         st.write(line)
                         if meta:
-                            st.json(meta)
+                            st.json(orjson.dumps(meta, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
 
             except Exception as e:
                 st.error(f"Review failed: {str(e)}")
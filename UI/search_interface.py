@@ -8,18 +8,40 @@ st.set_page_config(page_title="Nobias Search", layout="wide")
 
 st.title("🔍 Nobias Review Archive Search")
 
+
+@st.cache_data(max_entries=256)
+def load_report(path: str, mtime_ns: int) -> bytes:
+    """Report bytes; mtime is part of the cache key, so edited reports are re-read."""
+    return Path(path).read_bytes()
+
+
+@st.cache_data(max_entries=4)
+def list_reports(directory: str, dir_mtime_ns: int) -> list[tuple[str, str]]:
+    """
+    (file name, lowercased name) for every report, newest name first. Adding or
+    removing a report changes the directory mtime, which re-runs the glob.
+    """
+    names = sorted((p.name for p in Path(directory).glob("*.md")), reverse=True)
+    return [(name, name.lower()) for name in names]
+
+
 reports_dir = Path("reports")
-reports = sorted(reports_dir.glob("*.md"), reverse=True)
+try:
+    reports = list_reports(str(reports_dir), reports_dir.stat().st_mtime_ns)
+except FileNotFoundError:
+    reports = []
 
 if not reports:
     st.info("No reviews yet. Submit a paper first!")
 else:
-    search = st.text_input("Search reports")
-    filtered = [r for r in reports if search.lower() in r.name.lower()]
+    query = st.text_input("Search reports").lower()
+    filtered = [reports_dir / name for name, lowered in reports if query in lowered]
 
     for report in filtered:
         with st.expander(f"📑 {report.stem}"):
-            content = report.read_text(encoding="utf-8")
+            # Expander bodies run on every rerun (each search keystroke), so
+            # reports come from the cache instead of being read twice each time.
+            data = load_report(str(report), report.stat().st_mtime_ns)
+            content = data.decode("utf-8")
             st.markdown(content[:2000] + ("..." if len(content) > 2000 else ""))
-            with open(report, "rb") as f:
-                st.download_button("Download Full", f, file_name=report.name, key=report.name)
\ No newline at end of file
+            st.download_button("Download Full", data, file_name=report.name, key=report.name)
\ No newline at end of file
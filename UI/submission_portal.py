@@ -12,9 +12,22 @@ st.set_page_config(page_title="Nobias Submission Portal", layout="centered")
 st.title("📄 Nobias Submission Portal")
 st.markdown("Submit your paper for transparent, bias-free review.")
 
-engine = ReviewEngine()
-report_generator = ReportGenerator()
-ingestor = DocumentIngestor()
+# Built once, not on every rerun; see UI/dashboard/app.py for the split
+# between shared and per-session objects.
+@st.cache_resource
+def get_ingestor() -> DocumentIngestor:
+    return DocumentIngestor()
+
+
+def get_session_core() -> tuple[ReviewEngine, ReportGenerator]:
+    if "engine" not in st.session_state:
+        st.session_state.engine = ReviewEngine()
+        st.session_state.report_generator = ReportGenerator()
+    return st.session_state.engine, st.session_state.report_generator
+
+
+engine, report_generator = get_session_core()
+ingestor = get_ingestor()
 
 uploaded_file = st.file_uploader("Upload PDF or text", type=["pdf", "txt", "md"])
 paper_text = st.text_area("Or paste text", height=300)
@@ -27,10 +40,8 @@ if st.button("Submit for Review", type="primary"):
         with st.spinner("Review in progress..."):
             try:
                 if uploaded_file:
-                    temp_path = Path("uploads") / uploaded_file.name
-                    temp_path.parent.mkdir(exist_ok=True)
-                    temp_path.write_bytes(uploaded_file.getvalue())
-                    doc = ingestor.ingest(temp_path)
+                    # Ingested from memory; the upload is never written to disk
+                    doc = ingestor.ingest_bytes(uploaded_file.getvalue(), uploaded_file.name)
                     result = engine.review_paper(doc)
                 else:
                     result = engine.review_paper(paper_text)
@@ -49,8 +60,8 @@ if st.button("Submit for Review", type="primary"):
                 # Full report
                 report_md = Path("reports") / report_path.name
                 if report_md.exists():
-                    st.markdown(report_md.read_text(encoding="utf-8"))
-                    with open(report_md, "rb") as f:
-                        st.download_button("Download Report", f, file_name=report_path.name)
+                    report_bytes = report_md.read_bytes()
+                    st.markdown(report_bytes.decode("utf-8"))
+                    st.download_button("Download Report", report_bytes, file_name=report_path.name)
             except Exception as e:
                 st.error(f"Error: {e}")
\ No newline at end of file
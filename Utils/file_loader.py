@@ -8,15 +8,13 @@ def load_paper(path: str | Path) -> str:
     Uses AdvancedPDFExtractor for PDFs.
     """
     p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(f"Paper not found: {path}")
-
-    suffix = p.suffix.lower()
-    if suffix == ".pdf":
-        extractor = AdvancedPDFExtractor(p)
-        data = extractor.extract_all()
-        extractor.close()
-        return data["text"]  # For now return text; full data can be used later
-    else:
+    # No exists() pre-check: opening the file reports a missing path itself
+    try:
+        if p.suffix.lower() == ".pdf":
+            # Text only: figure/table detection is left to callers that need it
+            with AdvancedPDFExtractor(p) as extractor:
+                return extractor.extract_text()
         # Fallback for text files
-        return p.read_text(encoding="utf-8", errors="ignore")
\ No newline at end of file
+        return p.read_text(encoding="utf-8", errors="ignore")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Paper not found: {path}") from None
\ No newline at end of file
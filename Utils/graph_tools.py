@@ -1,5 +1,6 @@
 # Utils/graph_tools.py
 
+from collections import deque
 from typing import Dict, List, Set, Tuple, Iterable
 
 
@@ -16,11 +17,14 @@ def build_directed_graph(edges: Iterable[Tuple[str, str]]) -> Dict[str, Set[str]
     """
     graph: Dict[str, Set[str]] = {}
     for src, dst in edges:
-        if src not in graph:
-            graph[src] = set()
+        # One lookup for src when it already exists. setdefault() would build
+        # a throwaway set() on every edge and is slower here.
+        targets = graph.get(src)
+        if targets is None:
+            targets = graph[src] = set()
+        targets.add(dst)
         if dst not in graph:
             graph[dst] = set()
-        graph[src].add(dst)
     return graph
 
 
@@ -46,17 +50,20 @@ def depth_first_search(graph: Dict[str, Set[str]], start: str) -> List[str]:
     """
     visited: Set[str] = set()
     order: List[str] = []
-
-    def _dfs(node: str):
+    if start not in graph:
+        return order
+
+    # Explicit stack instead of recursion, so long citation chains can't hit
+    # the recursion limit. Neighbors are pushed in reverse sorted order and
+    # visited-checked on pop, which reproduces the recursive visit order.
+    stack = [start]
+    while stack:
+        node = stack.pop()
         if node in visited:
-            return
+            continue
         visited.add(node)
         order.append(node)
-        for neighbor in sorted(graph.get(node, [])):
-            _dfs(neighbor)
-
-    if start in graph:
-        _dfs(start)
+        stack.extend(sorted(graph.get(node, ()), reverse=True))
     return order
 
 
@@ -69,19 +76,23 @@ def topological_sort(graph: Dict[str, Set[str]]) -> List[str]:
     Useful for ordering dependencies, e.g., a chain of citations
     or staged computations.
     """
+    # Nodes that only appear as edge targets get an empty adjacency set first,
+    # so the graph is never resized while it is being iterated.
+    missing = [dst for neighbors in graph.values() for dst in neighbors if dst not in graph]
+    for dst in missing:
+        graph.setdefault(dst, set())
+
     in_degree: Dict[str, int] = {node: 0 for node in graph}
-    for src, neighbors in graph.items():
+    for neighbors in graph.values():
         for dst in neighbors:
-            in_degree[dst] = in_degree.get(dst, 0) + 1
-            if dst not in graph:
-                graph[dst] = set()
+            in_degree[dst] += 1
 
     # Kahn's algorithm
-    queue: List[str] = [node for node, deg in in_degree.items() if deg == 0]
+    queue = deque(node for node, deg in in_degree.items() if deg == 0)
     result: List[str] = []
 
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         result.append(node)
         for neighbor in graph.get(node, []):
             in_degree[neighbor] -= 1
@@ -90,8 +101,7 @@ def topological_sort(graph: Dict[str, Set[str]]) -> List[str]:
 
     # If some nodes weren't processed (cycle), append them
     if len(result) < len(graph):
-        for node in graph:
-            if node not in result:
-                result.append(node)
+        done = set(result)
+        result.extend(node for node in graph if node not in done)
 
     return result
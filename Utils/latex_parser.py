@@ -1,62 +1,76 @@
 # Utils/latex_parser.py
 import re
 
+# Patterns are compiled once at import; strip_latex applies them in order.
+_COMMENT = re.compile(r"%.*$", re.MULTILINE)
+
+# Environments: abstract/document keep their content, figures/tables are dropped
+_KEEP_ENV = re.compile(r"\\begin\{(abstract|document)\}(.*?)\\end\{\1\}", re.DOTALL)
+_DROP_ENV = re.compile(r"\\begin\{(figure|table)\}.*?\\end\{\1\}", re.DOTALL)
+
+_SECTION = re.compile(r"\\(?:section|subsection|subsubsection)\{([^}]*)\}")
+_REFERENCE = re.compile(r"\\(?:cite|ref|label|eqref)\{[^}]*\}")
+# Intentional LaTeX commands — suppress typo warnings
+# noinspection SpellCheckingInspection
+_EMPHASIS = re.compile(r"\\(?:textbf|textit|emph)\{([^}]*)\}")
+
+_INLINE_MATH = re.compile(r"\$[^\$]*\$")
+_DISPLAY_MATH = re.compile(r"\$\$.*?\$\$|\\\[.*?\\\]", re.DOTALL)
+
+# Common commands, removed in a single pass
+# noinspection SpellCheckingInspection
+_COMMANDS = re.compile(
+    r"\\title\{.*?\}"
+    r"|\\author\{.*?\}"
+    r"|\\maketitle"
+    r"|\\usepackage\{.*?\}"
+    r"|\\documentclass\[.*?\]\{.*?\}"
+    r"|\\begin\{.*?\}"
+    r"|\\end\{.*?\}",
+    re.DOTALL,
+)
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+# Only runs that actually change: a tab, or two or more blanks. Single spaces
+# (most of the text) are left alone instead of being replaced by themselves.
+_SPACES = re.compile(r"\t[ \t]*| [ \t]+")
+
 
 def strip_latex(text: str) -> str:
     """
     Lightweight LaTeX cleaner for arXiv-style papers.
     Removes common commands, environments, and math markup while preserving readability.
     """
-    if not text.strip():
+    if not text or text.isspace():
         return ""
 
     # Remove comments
-    text = re.sub(r"%.*$", "", text, flags=re.MULTILINE)
-
-    # Remove common environments (keep content)
-    env_patterns = [
-        r"\\begin\{abstract\}(.*?)\\end\{abstract\}",
-        r"\\begin\{document\}(.*?)\\end\{document\}",
-        r"\\begin\{figure\}.*?\\end\{figure\}",
-        r"\\begin\{table\}.*?\\end\{table\}",
-    ]
-    for pat in env_patterns:
-        text = re.sub(pat, r"\1", text, flags=re.DOTALL)
+    text = _COMMENT.sub("", text)
+
+    # Remove common environments (keep abstract/document content)
+    text = _KEEP_ENV.sub(r"\2", text)
+    text = _DROP_ENV.sub("", text)
 
     # Remove \section{...}, \subsection{...}
-    text = re.sub(r"\\(?:section|subsection|subsubsection)\{([^}]*)\}", r"\1", text)
+    text = _SECTION.sub(r"\1", text)
 
     # Remove \cite{...}, \ref{...}, \label{...}
-    text = re.sub(r"\\(?:cite|ref|label|eqref)\{[^}]*\}", "", text)
+    text = _REFERENCE.sub("", text)
 
     # Remove \textbf{...}, \textit{...}, \emph{...}
-    # Intentional LaTeX commands — suppress typo warnings
-    # noinspection SpellCheckingInspection
-    text = re.sub(r"\\(?:textbf|textit|emph)\{([^}]*)\}", r"\1", text)
+    text = _EMPHASIS.sub(r"\1", text)
 
     # Remove inline math $...$
-    text = re.sub(r"\$[^\$]*\$", " [MATH] ", text)
+    text = _INLINE_MATH.sub(" [MATH] ", text)
 
     # Remove display math $$...$$ or \[ ... \]
-    text = re.sub(r"\$\$.*?\$\$", " [DISPLAY MATH] ", text, flags=re.DOTALL)
-    text = re.sub(r"\\\[.*?\\\]", " [DISPLAY MATH] ", text, flags=re.DOTALL)
-
-    # Remove common commands (with typo suppression)
-    # noinspection SpellCheckingInspection
-    commands_to_remove = [
-        r"\\title\{.*?\}",
-        r"\\author\{.*?\}",
-        r"\\maketitle",
-        r"\\usepackage\{.*?\}",
-        r"\\documentclass\[.*?\]\{.*?\}",
-        r"\\begin\{.*?\}",
-        r"\\end\{.*?\}",
-    ]
-    for cmd in commands_to_remove:
-        text = re.sub(cmd, "", text, flags=re.DOTALL)
+    text = _DISPLAY_MATH.sub(" [DISPLAY MATH] ", text)
+
+    # Remove common commands
+    text = _COMMANDS.sub("", text)
 
     # Clean up excessive whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _BLANK_LINES.sub("\n\n", text)
+    text = _SPACES.sub(" ", text)
 
-    return text.strip()
\ No newline at end of file
+    return text.strip()
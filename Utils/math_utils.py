@@ -14,11 +14,26 @@ class MathDetector:
     EQUATION_ENV = re.compile(r"\\begin\{equation\*?\}.*?\\end\{equation\*?\}", re.DOTALL)
     COMMON_SYMBOLS = re.compile(r"\\[a-zA-Z]+|\{.*?\}|_|\^")
 
+    # Result for empty / whitespace-only text (no pattern can match)
+    _EMPTY_RESULT: Dict[str, Any] = {
+        "inline_math_count": 0,
+        "display_math_count": 0,
+        "total_equations": 0,
+        "symbol_density": 0.0,
+        "math_density_score": 0.0,
+        "is_theory_heavy": False,
+    }
+
     @staticmethod
-    def analyze(text: str) -> Dict[str, Any]:
+    def analyze(text: str, word_count: int | None = None) -> Dict[str, Any]:
+        if not text or text.isspace():
+            return dict(MathDetector._EMPTY_RESULT)
+        # word_count: pass it in when the caller has already split the text
+        if word_count is None:
+            word_count = len(text.split())
         inline_count = len(MathDetector.INLINE_MATH.findall(text))
         display_count = len(MathDetector.DISPLAY_MATH.findall(text)) + len(MathDetector.EQUATION_ENV.findall(text))
-        symbol_density = len(MathDetector.COMMON_SYMBOLS.findall(text)) / max(len(text.split()), 1)
+        symbol_density = len(MathDetector.COMMON_SYMBOLS.findall(text)) / max(word_count, 1)
 
         total_equations = inline_count + display_count
         math_density_score = min(1.0, (total_equations / 50.0) + (symbol_density / 5.0))
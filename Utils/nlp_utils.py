@@ -2,18 +2,31 @@
 import re
 from typing import List, Tuple
 
+# Sentence break: .!? followed by space and capital letter, or paragraph.
+# Matched from the punctuation / first newline rather than with lookbehinds,
+# which the regex engine would otherwise try at every position.
+_SENTENCE_BREAK = re.compile(r'[.!?]\s+(?=[A-Z])|\n\n(?=[A-Z])')
+_WORD = re.compile(r"[a-zA-Z]+(?:['-][a-zA-Z]+)*|\d+(?:\.\d+)?|[^\s\w]")
+
 
 def sent_tokenize(text: str) -> List[str]:
     """
     Lightweight sentence tokenizer (no external deps).
     Better than split('.') for scientific text.
     """
-    if not text.strip():
+    text = text.strip()
+    if not text:
         return []
 
-    # Split on .!? followed by space and capital letter, or paragraph
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])|(?<=\n\n)(?=[A-Z])', text.strip())
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences: List[str] = []
+    start = 0
+    for m in _SENTENCE_BREAK.finditer(text):
+        # The sentence keeps its punctuation; a paragraph break's newline is stripped
+        if sentence := text[start:m.start() + 1].strip():
+            sentences.append(sentence)
+        start = m.end()
+    if sentence := text[start:].strip():
+        sentences.append(sentence)
     return sentences
 
 
@@ -21,7 +34,7 @@ def word_tokenize(text: str) -> List[str]:
     """
     Simple word tokenizer preserving scientific terms.
     """
-    return re.findall(r"[a-zA-Z]+(?:['-][a-zA-Z]+)*|\d+(?:\.\d+)?|[^\s\w]", text)
+    return _WORD.findall(text)
 
 
 def ngrams(tokens: List[str], n: int = 2) -> List[Tuple[str, ...]]:
@@ -30,5 +43,5 @@ def ngrams(tokens: List[str], n: int = 2) -> List[Tuple[str, ...]]:
     """
     if len(tokens) < n:
         return []
-    # Explicit loop to avoid zip type checker warning
-    return [tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
\ No newline at end of file
+    # zip over n shifted views builds each tuple in C (no per-n-gram slice)
+    return list(zip(*(tokens[i:] for i in range(n))))
\ No newline at end of file
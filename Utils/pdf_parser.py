@@ -1,7 +1,6 @@
 # Utils/pdf_parser.py
 from __future__ import annotations
 
-import fitz  # PyMuPDF
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 import re
@@ -10,73 +9,138 @@ class AdvancedPDFExtractor:
     """
     Advanced PDF extraction using PyMuPDF (fitz).
     Extracts text, detects figures and tables, preserves reading order.
+
+    Pass `stream` to read an in-memory PDF; `path` is then only its name.
     """
-    def __init__(self, path: str | Path):
+
+    # Image stream filter -> extension; everything else is reported as png
+    # (what extract_image() would have converted it to)
+    _IMAGE_EXTENSIONS = {"DCTDecode": "jpeg", "JPXDecode": "jpx"}
+
+    def __init__(self, path: str | Path, stream: bytes | None = None):
         self.path = Path(path)
-        if not self.path.exists():
+        if stream is None and not self.path.exists():
             raise FileNotFoundError(f"PDF not found: {path}")
-        self.doc = fitz.open(self.path)
+        import fitz  # PyMuPDF; deferred so importing Utils stays cheap
+
+        if stream is None:
+            self.doc = fitz.open(self.path)
+        else:
+            self.doc = fitz.open(stream=stream, filetype="pdf")
 
     def extract_text(self) -> str:
         """Extract clean text preserving reading order."""
-        text_blocks = []
+        text_blocks: List[str] = []
         for page in self.doc:
-            blocks = page.get_text("blocks", sort=True)  # sort=True preserves reading order
-            for block in blocks:
-                text = block[4].strip()  # block text
-                if text:
-                    text_blocks.append(text)
+            text_blocks.extend(self._block_texts(self._sorted_blocks(page)))
         return "\n\n".join(text_blocks)
 
     def detect_figures(self) -> List[Dict[str, Any]]:
         """Detect figures by image blocks."""
         figures = []
         for page_num, page in enumerate(self.doc, start=1):
-            image_list = page.get_images(full=True)
-            for img_index, img in enumerate(image_list):
-                xref = img[0]
-                base_image = self.doc.extract_image(xref)
-                figures.append({
-                    "page": page_num,
-                    "image_index": img_index,
-                    "width": img[2],
-                    "height": img[3],
-                    "ext": base_image["ext"],
-                    "size_bytes": len(base_image["image"]),
-                })
+            figures.extend(self._page_figures(page_num, page))
         return figures
 
     def detect_tables(self) -> List[Dict[str, Any]]:
         """Simple table detection via horizontal/vertical lines and text density."""
         tables = []
         for page_num, page in enumerate(self.doc, start=1):
-            # Get drawings (lines)
-            drawings = page.get_drawings()
-            horiz_lines = [d for d in drawings if abs(d["rect"][3] - d["rect"][1]) < 5]  # thin horizontal
-            vert_lines = [d for d in drawings if abs(d["rect"][2] - d["rect"][0]) < 5]  # thin vertical
-
-            if len(horiz_lines) > 4 and len(vert_lines) > 2:  # heuristic for table
-                # Get text in page
-                text_blocks = page.get_text("dict")["blocks"]
-                table_text = [b["lines"] for b in text_blocks if b["type"] == 0]
-                tables.append({
-                    "page": page_num,
-                    "line_count": len(table_text),
-                    "horiz_lines": len(horiz_lines),
-                    "vert_lines": len(vert_lines),
-                    "confidence": "high" if len(horiz_lines) > 8 else "medium",
-                })
+            table = self._page_table(page_num, page)
+            if table is not None:
+                tables.append(table)
         return tables
 
     def extract_all(self) -> Dict[str, Any]:
-        """Extract everything in one call."""
+        """
+        Extract everything in one call.
+
+        One pass over the pages: each page is loaded once and its text blocks
+        serve both the text and the table detection.
+        """
+        text_blocks: List[str] = []
+        figures: List[Dict[str, Any]] = []
+        tables: List[Dict[str, Any]] = []
+        for page_num, page in enumerate(self.doc, start=1):
+            blocks = self._sorted_blocks(page)
+            text_blocks.extend(self._block_texts(blocks))
+            figures.extend(self._page_figures(page_num, page))
+            table = self._page_table(page_num, page, blocks)
+            if table is not None:
+                tables.append(table)
+
         return {
-            "text": self.extract_text(),
-            "figures": self.detect_figures(),
-            "tables": self.detect_tables(),
+            "text": "\n\n".join(text_blocks),
+            "figures": figures,
+            "tables": tables,
             "page_count": len(self.doc),
             "metadata": self.doc.metadata,
         }
 
+    @staticmethod
+    def _sorted_blocks(page: Any) -> List[Tuple]:
+        # sort=True preserves reading order
+        return page.get_text("blocks", sort=True)
+
+    @staticmethod
+    def _block_texts(blocks: List[Tuple]) -> List[str]:
+        # block[4] is the block text
+        return [text for block in blocks if (text := block[4].strip())]
+
+    def _page_figures(self, page_num: int, page: Any) -> List[Dict[str, Any]]:
+        figures = []
+        # Inventory only: extract_image() would decode (and re-encode as PNG)
+        # every non-JPEG image. The filter name (img[8]) gives the type and
+        # size_bytes is the image's stored (compressed) size in the PDF.
+        for img_index, img in enumerate(page.get_images(full=True)):
+            xref = img[0]
+            figures.append({
+                "page": page_num,
+                "image_index": img_index,
+                "width": img[2],
+                "height": img[3],
+                "ext": self._IMAGE_EXTENSIONS.get(img[8], "png"),
+                "size_bytes": len(self.doc.xref_stream_raw(xref)),
+            })
+        return figures
+
+    @staticmethod
+    def _page_table(page_num: int, page: Any, blocks: List[Tuple] | None = None) -> Dict[str, Any] | None:
+        # Get drawings (lines)
+        drawings = page.get_drawings()
+        # A table needs at least 5 thin horizontal lines; fewer drawings can't
+        # qualify (a tiny mark counts as both horizontal and vertical).
+        if len(drawings) < 5:
+            return None
+
+        horiz_lines = vert_lines = 0
+        for d in drawings:
+            x0, y0, x1, y1 = d["rect"]
+            if abs(y1 - y0) < 5:  # thin horizontal
+                horiz_lines += 1
+            if abs(x1 - x0) < 5:  # thin vertical
+                vert_lines += 1
+
+        if not (horiz_lines > 4 and vert_lines > 2):  # heuristic for table
+            return None
+
+        # Count text blocks (block[6] == 0). "blocks" gives the same blocks as
+        # "dict" without building per-span/char dicts; order doesn't matter.
+        if blocks is None:
+            blocks = page.get_text("blocks")
+        return {
+            "page": page_num,
+            "line_count": sum(1 for b in blocks if b[6] == 0),
+            "horiz_lines": horiz_lines,
+            "vert_lines": vert_lines,
+            "confidence": "high" if horiz_lines > 8 else "medium",
+        }
+
     def close(self):
-        self.doc.close()
\ No newline at end of file
+        self.doc.close()
+
+    def __enter__(self) -> AdvancedPDFExtractor:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
\ No newline at end of file
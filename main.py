@@ -2,25 +2,33 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Dict
 
-from Core.ingestion import DocumentIngestor
+from Core.ingestion import Document
 from Core.review_engine import ReviewEngine
 from Core.report_generator import ReportGenerator
 
+PAPERS_DIR = Path(__file__).resolve().parent / "papers"
+PAPER_FILES = (
+    "astrophysics_example.pdf",
+    "medical_example.pdf",
+    "psychology_example.pdf",
+    "social_science_example.pdf",
+    "Prometheus_Prime_Paper_1.pdf",
+)
 
-def review_single_paper(
+
+def report_review(
     paper_path: Path,
-    engine: ReviewEngine,
+    doc: Document,
+    result: Dict[str, Any],
     report_generator: ReportGenerator,
-    ingestor: DocumentIngestor,
 ) -> None:
+    """Print the summary for one reviewed paper and save its Markdown report."""
     print("=" * 80)
     print(f"Reviewing: {paper_path.name}")
     print("=" * 80)
 
-    # --- Ingestion ---
-    doc = ingestor.ingest(paper_path)
-
     # --- Ingestion metadata (debug-friendly, minimal) ---
     print(
         f"[Ingestion] "
@@ -31,9 +39,6 @@ def review_single_paper(
         f"sections={len(doc.sections)}"
     )
 
-    # --- Review (use clean_text for analysis) ---
-    result = engine.review_paper(doc)
-
     integrity = result["integrity"]
     bias = result["bias"]
     stats = result["statistics"]
@@ -111,24 +116,15 @@ def review_single_paper(
 
 
 def main() -> None:
-    project_root = Path(__file__).resolve().parent
-    papers_dir = project_root / "papers"
-
-    paper_files = [
-        "astrophysics_example.pdf",
-        "medical_example.pdf",
-        "psychology_example.pdf",
-        "social_science_example.pdf",
-        "Prometheus_Prime_Paper_1.pdf",
-    ]
-
+    paper_paths = [PAPERS_DIR / paper_name for paper_name in PAPER_FILES]
     engine = ReviewEngine()
     report_generator = ReportGenerator()
-    ingestor = DocumentIngestor()
 
-    for paper_name in paper_files:
-        pdf_path = papers_dir / paper_name
-        review_single_paper(pdf_path, engine, report_generator, ingestor)
+    # Papers are independent: review_files ingests and reviews them in worker
+    # processes and yields in input order, so each summary and report comes
+    # out as soon as the papers before it are done.
+    for paper_path, (doc, result) in zip(paper_paths, engine.review_files(paper_paths)):
+        report_review(paper_path, doc, result, report_generator)
 
 
 if __name__ == "__main__":